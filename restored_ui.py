@@ -4,8 +4,9 @@ Restored Working Web UI for Email Company Tool
 Simple and reliable version
 """
 
-from flask import Flask, request, send_file, jsonify
+from flask import Flask, request, send_from_directory, jsonify
 import os
+import re
 import pandas as pd
 import threading
 import time
@@ -13,6 +14,8 @@ import uuid
 from main import process_emails
 
 app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = 256 * 1024 * 1024  # allow large uploads
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
 
 # Configuration
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -26,6 +29,34 @@ os.makedirs(OUTPUT_FOLDER, exist_ok=True)
 # Job storage
 jobs = {}
 
+# Job IDs are short uuid4 prefixes; reject anything else before touching paths
+_JOB_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
+# Email extraction pattern, compiled once at import instead of per call
+# site. google-re2 (optional) scans with a linear-time DFA instead of re's
+# backtracking engine — the compute-bound step on multi-MB PDF/DOCX/TXT
+# payloads; stdlib re is the drop-in fallback.
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b'
+try:
+    import re2 as _email_re
+except ImportError:
+    _email_re = re
+_EMAIL_RX = _email_re.compile(EMAIL_PATTERN, _email_re.IGNORECASE)
+
+
+def _extract_emails(text):
+    """All email addresses in text, lowercased, order-preserving unique."""
+    return list(dict.fromkeys(m.lower() for m in _EMAIL_RX.findall(text)))
+
+# Guards job-state mutations: workers update fields in place instead of
+# re-binding whole dicts, so /status polls never see torn or replaced state
+_JOBS_LOCK = threading.Lock()
+
+def _update_job(job_id, **fields):
+    """Update a job's state in place under the jobs lock."""
+    with _JOBS_LOCK:
+        jobs.setdefault(job_id, {}).update(fields)
+
 def extract_name_from_email(email):
     """
     Extract a name from the email address itself (from the part before @)
@@ -78,78 +109,72 @@ def extract_name_from_email(email):
     except:
         return 'Unknown'
 
+def _name_from_line(email, line):
+    """Name associated with `email` on `line`, or '' if no pattern hits."""
+    escaped = re.escape(email)
+    for pattern in (
+            r'([A-Za-z\s]+)\s*<\s*' + escaped + r'\s*>',   # Name <email>
+            r'([A-Za-z\s]+)[\s]*[:\-]\s*' + escaped,        # Name: email
+            escaped + r'[\s]*[:\-]\s*([A-Za-z\s]+)'):       # email: Name
+        name_match = re.search(pattern, line, re.IGNORECASE)
+        if name_match:
+            return name_match.group(1).strip()
+    return ''
+
 def extract_emails_with_context(text, fast_mode=True):
     """
     Extract emails along with potential associated names and other data from text.
+    `text` may be a single string or an iterable of text chunks (PDF pages,
+    DOCX paragraphs, ...); chunks stream through the extractor one at a
+    time, so no whole-document string is ever materialized and peak memory
+    stays around one chunk.
     Returns: emails list, names list, other_data list
     """
-    import re
-    
-    # Email pattern - optimized for speed
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    
-    # Find all emails - compile regex once for better performance
-    email_regex = re.compile(email_pattern, re.IGNORECASE)
-    emails = email_regex.findall(text)
-    
-    # Remove duplicates while preserving order - faster method
-    seen = set()
+    chunks = [text] if isinstance(text, str) else text
+
     unique_emails = []
-    for email in emails:
-        email_lower = email.lower()
-        if email_lower not in seen:
-            unique_emails.append(email_lower)
-            seen.add(email_lower)
-    
+    seen = set()
+    context_names = {}  # email -> name found on a containing line (detailed mode)
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if fast_mode:
+            for email in _EMAIL_RX.findall(chunk):
+                email = email.lower()
+                if email not in seen:
+                    seen.add(email)
+                    unique_emails.append(email)
+        else:
+            # Match name context while scanning, so the pass below never
+            # re-walks the document. An email's first containing line may
+            # be a bare mention, so keep trying later containing lines
+            # until one actually yields a name
+            for line in chunk.split('\n'):
+                for email in _EMAIL_RX.findall(line):
+                    email = email.lower()
+                    if email not in seen:
+                        seen.add(email)
+                        unique_emails.append(email)
+                    if not context_names.get(email):
+                        context_names[email] = _name_from_line(email, line.strip())
+
     names = []
     other_data = []
-    
+
     if fast_mode:
         # Fast mode - extract names from email addresses
         for email in unique_emails:
-            name = extract_name_from_email(email)
-            names.append(name)
+            names.append(extract_name_from_email(email))
             other_data.append('')
         return unique_emails, names, other_data
-    
-    # Detailed mode - try to find names in context (slower but more complete)
-    lines = text.split('\n')
-    
+
+    # Detailed mode - use the name found during the scan, falling back to
+    # one derived from the address itself
     for email in unique_emails:
-        name = ''
-        extra_info = ''
-        
-        # Look for the email in text and try to find associated name
-        for line in lines:
-            if email.lower() in line.lower():
-                line_clean = line.strip()
-                
-                # Try common patterns
-                # Pattern 1: Name <email>
-                name_match = re.search(r'([A-Za-z\s]+)\s*<\s*' + re.escape(email) + r'\s*>', line_clean, re.IGNORECASE)
-                if name_match:
-                    name = name_match.group(1).strip()
-                    break
-                
-                # Pattern 2: Name: email or Name - email
-                name_match = re.search(r'([A-Za-z\s]+)[\s]*[:\-]\s*' + re.escape(email), line_clean, re.IGNORECASE)
-                if name_match:
-                    name = name_match.group(1).strip()
-                    break
-                
-                # Pattern 3: email - Name or email: Name
-                name_match = re.search(re.escape(email) + r'[\s]*[:\-]\s*([A-Za-z\s]+)', line_clean, re.IGNORECASE)
-                if name_match:
-                    name = name_match.group(1).strip()
-                    break
-        
-        # If no name found in context, extract from email
-        if not name:
-            name = extract_name_from_email(email)
-        
-        names.append(name)
-        other_data.append(extra_info)
-    
+        names.append(context_names.get(email) or extract_name_from_email(email))
+        other_data.append('')
+
     return unique_emails, names, other_data
 
 def create_dataframe_from_emails(emails, names=None, other_data=None):
@@ -208,78 +233,63 @@ def fast_process_emails(emails_df):
         for _, row in mapping_df.iterrows():
             domain_lookup[row['domain'].lower()] = (row['company'], row['sector'])
         
-        # Fast matching function with enhanced logic
-        def quick_match(domain):
-            domain_lower = domain.lower().strip()
-            
+        choices = list(domain_lookup.keys())
+
+        # Cheap dictionary phases, evaluated per unique domain
+        def _cheap_match(domain_lower):
             # Direct lookup first
             if domain_lower in domain_lookup:
-                return pd.Series(domain_lookup[domain_lower])
-            
+                return domain_lookup[domain_lower]
+
             # Try with .com extension
             domain_com = f"{domain_lower}.com"
             if domain_com in domain_lookup:
-                return pd.Series(domain_lookup[domain_com])
-            
+                return domain_lookup[domain_com]
+
             # Try removing common extensions and matching
             for ext in ['.com', '.net', '.org', '.io', '.co', '.tech', '.biz', '.ai']:
                 if domain_lower.endswith(ext):
                     base_domain = domain_lower[:-len(ext)]
                     if base_domain in domain_lookup:
-                        return pd.Series(domain_lookup[base_domain])
-            
+                        return domain_lookup[base_domain]
+
             # Try partial matching (contains)
-            for domain_key in domain_lookup.keys():
+            for domain_key in choices:
                 if domain_lower in domain_key or domain_key in domain_lower:
                     if abs(len(domain_lower) - len(domain_key)) <= 3:  # Similar length
-                        return pd.Series(domain_lookup[domain_key])
-            
-            # Try fuzzy matching with multiple algorithms and lower threshold
-            from rapidfuzz import process, fuzz
-            choices = list(domain_lookup.keys())
-            
-            # Try different scoring methods
-            best_matches = [
-                process.extractOne(domain_lower, choices, scorer=fuzz.ratio),
-                process.extractOne(domain_lower, choices, scorer=fuzz.partial_ratio),
-                process.extractOne(domain_lower, choices, scorer=fuzz.token_sort_ratio),
-                process.extractOne(domain_lower, choices, scorer=fuzz.token_set_ratio)
-            ]
-            
-            # Use the best match with score >= 70% (lowered from 80%)
-            for match in best_matches:
-                if match and match[1] >= 70:
-                    return pd.Series(domain_lookup[match[0]])
-            
-            # Try matching common patterns (remove numbers, common suffixes)
-            cleaned_domain = domain_lower
-            # Remove numbers
-            import re
-            cleaned_domain = re.sub(r'\d+', '', cleaned_domain)
-            # Remove common business suffixes
-            suffixes = ['corp', 'inc', 'llc', 'ltd', 'company', 'co', 'group', 'international', 'intl', 'global', 'usa', 'us', 'solutions', 'services', 'systems', 'tech', 'technologies']
-            for suffix in suffixes:
-                if cleaned_domain.endswith(suffix):
-                    cleaned_domain = cleaned_domain[:-len(suffix)]
+                        return domain_lookup[domain_key]
+
+            return None
+
+        def _fuzzy_batch(queries, scorers, threshold):
+            """Best dataset hit per query string. One C-level cdist matrix
+            per scorer across all cores, instead of a Python-loop
+            extractOne per row per scorer; scorers are tried in order so
+            the acceptance semantics match the old per-row cascade."""
+            from rapidfuzz import process
+            out = {}
+            remaining = list(queries)
+            for scorer in scorers:
+                if not remaining:
                     break
-            
-            # Try matching the cleaned domain
-            if cleaned_domain and cleaned_domain != domain_lower and cleaned_domain in domain_lookup:
-                return pd.Series(domain_lookup[cleaned_domain])
-            
-            # Try fuzzy matching on cleaned domain
-            if cleaned_domain and len(cleaned_domain) > 2:
-                best_match = process.extractOne(cleaned_domain, choices, scorer=fuzz.ratio)
-                if best_match and best_match[1] >= 65:  # Even lower threshold for cleaned domain
-                    return pd.Series(domain_lookup[best_match[0]])
-            
-            # If still no match, try to generate a reasonable company name from domain
+                scores = process.cdist(remaining, choices, scorer=scorer, workers=-1)
+                next_round = []
+                for qi, query in enumerate(remaining):
+                    ci = int(scores[qi].argmax())
+                    if scores[qi][ci] >= threshold:
+                        out[query] = domain_lookup[choices[ci]]
+                    else:
+                        next_round.append(query)
+                remaining = next_round
+            return out
+
+        def _generate_fallback(domain_lower):
+            # Generate a reasonable company name from the domain itself
             company_name = domain_lower.replace('.', ' ').replace('-', ' ').replace('_', ' ')
-            # Clean up the company name
             words = company_name.split()
             if words:
                 # Filter out very short words and common terms
-                meaningful_words = [word.capitalize() for word in words 
+                meaningful_words = [word.capitalize() for word in words
                                  if len(word) > 2 and word.lower() not in ['com', 'net', 'org', 'www', 'mail', 'email']]
                 if meaningful_words:
                     company_name = ' '.join(meaningful_words)
@@ -297,13 +307,76 @@ def fast_process_emails(emails_df):
                         sector = 'Manufacturing'
                     elif any(service_word in domain_lower for service_word in ['consulting', 'advisory', 'service', 'solution']):
                         sector = 'Consulting'
-                    
-                    return pd.Series([company_name, sector])
-            
-            return pd.Series(['Unknown', 'Unknown'])
-        
-        # Apply quick matching
-        result_df[["company", "sector"]] = result_df["domain"].apply(quick_match)
+
+                    return (company_name, sector)
+
+            return ('Unknown', 'Unknown')
+
+        _suffixes = ['corp', 'inc', 'llc', 'ltd', 'company', 'co', 'group',
+                     'international', 'intl', 'global', 'usa', 'us', 'solutions',
+                     'services', 'systems', 'tech', 'technologies']
+
+        def _cleaned(domain_lower):
+            # Remove numbers and common business suffixes
+            cleaned = re.sub(r'\d+', '', domain_lower)
+            for suffix in _suffixes:
+                if cleaned.endswith(suffix):
+                    cleaned = cleaned[:-len(suffix)]
+                    break
+            return cleaned
+
+        # Match each unique domain exactly once (the old row-wise apply
+        # recomputed duplicates), pushing the fuzzy stage through cdist
+        matches = {}
+        fuzzy_pending = []
+        for domain in pd.unique(result_df['domain'].astype(str)):
+            domain_lower = domain.lower().strip()
+            hit = _cheap_match(domain_lower)
+            if hit:
+                matches[domain] = hit
+            else:
+                fuzzy_pending.append(domain)
+
+        if fuzzy_pending and choices:
+            from rapidfuzz import fuzz
+            lowered = [d.lower().strip() for d in fuzzy_pending]
+            hits = _fuzzy_batch(
+                lowered,
+                (fuzz.ratio, fuzz.partial_ratio, fuzz.token_sort_ratio, fuzz.token_set_ratio),
+                70)
+
+            cleaned_queries = {}
+            for domain, domain_lower in zip(fuzzy_pending, lowered):
+                if domain_lower in hits:
+                    matches[domain] = hits[domain_lower]
+                    continue
+                # Retry on the cleaned domain: exact lookup, then one more
+                # (lower-threshold) fuzzy round batched below
+                cleaned = _cleaned(domain_lower)
+                if cleaned and cleaned != domain_lower and cleaned in domain_lookup:
+                    matches[domain] = domain_lookup[cleaned]
+                elif cleaned and len(cleaned) > 2:
+                    cleaned_queries[domain] = cleaned
+
+            if cleaned_queries:
+                from rapidfuzz import fuzz
+                cleaned_hits = _fuzzy_batch(
+                    set(cleaned_queries.values()), (fuzz.ratio,), 65)
+                for domain, cleaned in cleaned_queries.items():
+                    if cleaned in cleaned_hits:
+                        matches[domain] = cleaned_hits[cleaned]
+
+            for domain in fuzzy_pending:
+                if domain not in matches:
+                    matches[domain] = _generate_fallback(domain.lower().strip())
+        else:
+            for domain in fuzzy_pending:
+                matches[domain] = _generate_fallback(domain.lower().strip())
+
+        # Two dict-backed map calls instead of a per-row apply
+        domains_str = result_df['domain'].astype(str)
+        result_df['company'] = domains_str.map(lambda d: matches[d][0])
+        result_df['sector'] = domains_str.map(lambda d: matches[d][1])
     else:
 
         # If no dataset, mark all as unknown
@@ -1190,13 +1263,13 @@ def process_file():
         file.save(filepath)
         
         # Initialize job status
-        jobs[job_id] = {'status': 'processing', 'start_time': time.time()}
+        _update_job(job_id, status='processing', start_time=time.time())
         
         # Start background processing
         def process_job():
             try:
                 # Update status to show fast processing
-                jobs[job_id]['status'] = 'reading_file'
+                _update_job(job_id, status='reading_file')
                 # Read file based on extension
                 file_ext = os.path.splitext(filepath)[1].lower()
                 df = None
@@ -1229,13 +1302,14 @@ def process_file():
                         if tables:
                             df = tables[0]  # Use first table
                         else:
-                            # If no tables, extract text and look for email patterns
-                            import re
-                            text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-                            emails, names, other_data = extract_emails_with_context(text, fast_mode=False)
+                            # If no tables, stream paragraph text straight
+                            # into the extractor - no joined document string
+                            emails, names, other_data = extract_emails_with_context(
+                                (paragraph.text for paragraph in doc.paragraphs),
+                                fast_mode=False)
                             df = create_dataframe_from_emails(emails, names, other_data)
                     except ImportError:
-                        jobs[job_id] = {'status': 'error', 'error': 'python-docx package required for Word files. Please install: pip install python-docx'}
+                        _update_job(job_id, status='error', error='python-docx package required for Word files. Please install: pip install python-docx')
                         return
                         
                 elif file_ext == '.pdf':
@@ -1246,14 +1320,36 @@ def process_file():
                         
                         tables = []
                         all_text = ""
-                        
-                        # Enhanced PDF processing - extract all tables and comprehensive text
+
+                        # Fast raw-text pass first: pypdfium2 (optional)
+                        # wraps the PDFium C++ engine and extracts plain
+                        # text an order of magnitude faster than
+                        # pdfplumber's layout analysis, which is wasted
+                        # work when the text only feeds the email regex
+                        try:
+                            import pypdfium2 as pdfium
+                            pdf_doc = pdfium.PdfDocument(filepath)
+                            try:
+                                page_texts = []
+                                for page_index in range(min(10, len(pdf_doc))):
+                                    textpage = pdf_doc[page_index].get_textpage()
+                                    page_texts.append(textpage.get_text_range())
+                                all_text = '\n'.join(page_texts)
+                            finally:
+                                pdf_doc.close()
+                        except Exception:
+                            all_text = ""
+
+                        # pdfplumber still does the structured work: table
+                        # extraction, plus per-page text only when the
+                        # PDFium pass was unavailable or came up empty
                         try:
                             with pdfplumber.open(filepath) as pdf:
                                 max_pages = min(10, len(pdf.pages))  # Increased to 10 pages for better coverage
+                                need_text = len(all_text.strip()) < 50
                                 for i in range(max_pages):
                                     page = pdf.pages[i]
-                                    
+
                                     # Extract all tables from this page
                                     page_tables = page.extract_tables()
                                     if page_tables:
@@ -1264,7 +1360,7 @@ def process_file():
                                                 for row in table:
                                                     cleaned_row = [str(cell).strip() if cell else '' for cell in row]
                                                     cleaned_table.append(cleaned_row)
-                                                
+
                                                 if len(cleaned_table) > 1:
                                                     headers = cleaned_table[0]
                                                     data = cleaned_table[1:]
@@ -1274,12 +1370,15 @@ def process_file():
                                                     except:
                                                         # If table creation fails, continue
                                                         pass
-                                    
+
+                                    if not need_text:
+                                        continue
+
                                     # Extract text more comprehensively
                                     page_text = page.extract_text()
                                     if page_text:
                                         all_text += page_text + "\n"
-                                    
+
                                     # Also try to extract text from individual words/characters if main extraction fails
                                     if not page_text:
                                         try:
@@ -1323,13 +1422,10 @@ def process_file():
                             
                             # If no email column found, look for emails in any column
                             if email_column is None:
-                                import re
-                                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                                
                                 for col in table_df.columns:
                                     if col is not None:
                                         sample_values = table_df[col].astype(str).head(5)
-                                        email_count = sum(1 for val in sample_values if re.search(email_pattern, val))
+                                        email_count = sum(1 for val in sample_values if _EMAIL_RX.search(val))
                                         if email_count > 0:
                                             email_column = col
                                             break
@@ -1340,12 +1436,10 @@ def process_file():
                                     table_df = table_df.rename(columns={email_column: 'email'})
                                 
                                 # Filter valid emails
-                                import re
-                                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
                                 table_df['email'] = table_df['email'].astype(str).str.strip().str.lower()
-                                
+
                                 # Keep only rows with valid emails
-                                valid_email_mask = table_df['email'].str.match(email_pattern)
+                                valid_email_mask = table_df['email'].str.match(EMAIL_PATTERN)
                                 table_df = table_df[valid_email_mask].copy()
                                 
                                 if len(table_df) > 0:
@@ -1364,7 +1458,7 @@ def process_file():
                             df = create_dataframe_from_emails(emails, names, other_data)
                             
                     except ImportError:
-                        jobs[job_id] = {'status': 'error', 'error': 'PDF processing packages required. Please install: pip install pdfplumber PyPDF2'}
+                        _update_job(job_id, status='error', error='PDF processing packages required. Please install: pip install pdfplumber PyPDF2')
                         return
                         
                 elif file_ext == '.txt':
@@ -1387,15 +1481,20 @@ def process_file():
                             except:
                                 continue
                         if df is None:
-                            jobs[job_id] = {'status': 'error', 'error': 'Unable to read text file with any supported encoding'}
+                            _update_job(job_id, status='error', error='Unable to read text file with any supported encoding')
                             return
                             
                 elif file_ext == '.json':
                     # Handle JSON files
                     try:
-                        import json
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
+                        # Prefer orjson when available - its decoder is 2-3x
+                        # faster than stdlib json and returns the same types
+                        try:
+                            import orjson as _json
+                        except ImportError:
+                            import json as _json
+                        with open(filepath, 'rb') as f:
+                            data = _json.loads(f.read())
                         
                         # Convert JSON to DataFrame
                         if isinstance(data, list):
@@ -1413,7 +1512,7 @@ def process_file():
                             emails, names, other_data = extract_emails_with_context(text, fast_mode=False)
                             df = create_dataframe_from_emails(emails, names, other_data)
                     except Exception as e:
-                        jobs[job_id] = {'status': 'error', 'error': f'Error processing JSON file: {str(e)}'}
+                        _update_job(job_id, status='error', error=f'Error processing JSON file: {str(e)}')
                         return
                         
                 elif file_ext == '.xml':
@@ -1434,28 +1533,31 @@ def process_file():
                         xml_text = extract_text_from_element(root)
                         
                         # Try to convert XML to structured data
-                        xml_data = []
-                        
-                        # Look for repeating elements that might represent records
+                        # Look for repeating elements that might represent records.
+                        # Compute the column layout once from the first child's
+                        # signature, then append plain tuples in header order -
+                        # this avoids a fresh dict plus per-attribute f-string
+                        # formatting for every record and lets pandas use the
+                        # faster from_records path.
                         children = list(root)
                         if children:
+                            first = children[0]
+                            attr_keys = list(first.attrib)
+                            sub_tags = [sc.tag for sc in first]
+                            header = (['element_tag', 'element_text']
+                                      + [f'attr_{k}' for k in attr_keys]
+                                      + sub_tags)
+                            rows = []
                             for child in children:
-                                record = {}
-                                record['element_tag'] = child.tag
-                                record['element_text'] = child.text or ''
-                                
-                                # Add attributes
-                                for key, value in child.attrib.items():
-                                    record[f'attr_{key}'] = value
-                                
-                                # Add child elements
-                                for subchild in child:
-                                    record[subchild.tag] = subchild.text or ''
-                                
-                                xml_data.append(record)
-                            
-                            if xml_data:
-                                df = pd.DataFrame(xml_data)
+                                attrib = child.attrib
+                                subtexts = {sc.tag: sc.text or '' for sc in child}
+                                rows.append(
+                                    (child.tag, child.text or '')
+                                    + tuple(attrib.get(k, '') for k in attr_keys)
+                                    + tuple(subtexts.get(t, '') for t in sub_tags)
+                                )
+                            if rows:
+                                df = pd.DataFrame.from_records(rows, columns=header)
                         
                         # If no structured data found, extract emails from text
                         if df is None or df.empty:
@@ -1463,89 +1565,87 @@ def process_file():
                             df = create_dataframe_from_emails(emails, names, other_data)
                             
                     except Exception as e:
-                        jobs[job_id] = {'status': 'error', 'error': f'Error processing XML file: {str(e)}'}
+                        _update_job(job_id, status='error', error=f'Error processing XML file: {str(e)}')
                         return
                         
                 else:
-                    jobs[job_id] = {'status': 'error', 'error': f'Unsupported file format: {file_ext}. Supported formats: CSV, Excel (.xlsx/.xls), Word (.docx/.doc), PDF (.pdf), Text (.txt), JSON (.json), XML (.xml)'}
+                    _update_job(job_id, status='error', error=f'Unsupported file format: {file_ext}. Supported formats: CSV, Excel (.xlsx/.xls), Word (.docx/.doc), PDF (.pdf), Text (.txt), JSON (.json), XML (.xml)')
                     return
                 
                 if df is None or df.empty:
-                    jobs[job_id] = {'status': 'error', 'error': 'No data could be extracted from the file'}
+                    _update_job(job_id, status='error', error='No data could be extracted from the file')
                     return
                 
                 # Update status
-                jobs[job_id]['status'] = 'processing_emails'
+                _update_job(job_id, status='processing_emails')
                 
                 # Smart email column detection
                 email_column = None
-                
-                # Check for common email column variations (case-insensitive)
-                email_variations = ['email', 'emails', 'e-mail', 'e_mail', 'email_address', 
+
+                # Check for common email column variations (case-insensitive):
+                # one vectorized pass over the column index instead of a
+                # Python loop lowering each name
+                email_variations = ['email', 'emails', 'e-mail', 'e_mail', 'email_address',
                                   'emailaddress', 'mail', 'contact', 'contact_email']
-                
-                for col in df.columns:
-                    if col.lower().strip() in email_variations:
-                        email_column = col
-                        break
+
+                name_mask = df.columns.astype(str).str.lower().str.strip().isin(email_variations)
+                if name_mask.any():
+                    email_column = df.columns[name_mask.argmax()]
                 
                 # If no email column found, try to detect emails in any text column
                 if email_column is None:
-                    import re
-                    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                    
-                    for col in df.columns:
+                    # Only object/string columns can hold email text - skip
+                    # numeric/datetime columns and their astype(str) cost
+                    candidate_cols = [c for c in df.columns
+                                      if df[c].dtype == object or pd.api.types.is_string_dtype(df[c])]
+                    for col in candidate_cols:
                         # Check if this column contains email-like strings
                         sample_values = df[col].astype(str).head(10)
-                        email_count = sum(1 for val in sample_values if re.search(email_pattern, val))
-                        
+                        email_count = sum(1 for val in sample_values if _EMAIL_RX.search(val))
+
                         if email_count > 0:  # Found emails in this column
                             email_column = col
                             break
-                
+
                 if email_column is None:
                     # Last resort: look for emails in all text content
                     all_text = ' '.join([str(val) for col in df.columns for val in df[col].astype(str)])
-                    emails = re.findall(email_pattern, all_text)
-                    
+                    emails = _extract_emails(all_text)
+
                     if emails:
                         # Create new dataframe with found emails
                         df = pd.DataFrame({'email': emails})
                         email_column = 'email'
                     else:
-                        jobs[job_id] = {'status': 'error', 'error': 'No email addresses found in the file. Please ensure your file contains email addresses in any column.'}
+                        _update_job(job_id, status='error', error='No email addresses found in the file. Please ensure your file contains email addresses in any column.')
                         return
                 
                 # Rename the email column to 'email' for consistency
                 if email_column != 'email':
                     df = df.rename(columns={email_column: 'email'})
                 
-                # Clean and validate email data
-                import re
-                email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-                
                 # Clean the email column
                 df['email'] = df['email'].astype(str).str.strip().str.lower()
-                
+
                 # Filter out invalid emails and extract valid ones
                 valid_emails = []
                 for email_text in df['email']:
-                    # Extract email from text (in case there's extra text)
-                    matches = re.findall(email_pattern, email_text)
-                    if matches:
-                        valid_emails.append(matches[0])  # Take first valid email found
-                    else:
-                        valid_emails.append(None)  # Mark as invalid
+                    # Extract email from text (in case there's extra text);
+                    # only the first match is used, so search beats findall
+                    match = _EMAIL_RX.search(email_text)
+                    valid_emails.append(match.group(0) if match else None)
                 
                 df['email'] = valid_emails
-                
-                # Remove rows with invalid emails
+
+                # Remove rows with invalid emails: one boolean mask and one
+                # slice instead of two intermediate frames
                 original_count = len(df)
-                df = df.dropna(subset=['email'])
-                df = df[df['email'] != '']
+                valid_mask = df['email'].notna() & (df['email'] != '')
+                if not valid_mask.all():
+                    df = df.loc[valid_mask].reset_index(drop=True)
                 
                 if len(df) == 0:
-                    jobs[job_id] = {'status': 'error', 'error': f'No valid email addresses found in the file. Please check your email format.'}
+                    _update_job(job_id, status='error', error=f'No valid email addresses found in the file. Please check your email format.')
                     return
                 
                 if len(df) < original_count:
@@ -1573,15 +1673,18 @@ def process_file():
                 result_df.to_excel(result_path, index=False)
                 
                 # Update job status
-                jobs[job_id] = {
-                    'status': 'completed',
-                    'result_path': result_path,
-                    'total_emails': len(result_df),
-                    'identified': len(result_df[result_df['sector'] != 'Unknown'])
-                }
+                _update_job(
+                    job_id,
+                    status='completed',
+                    result_path=result_path,
+                    total_emails=len(result_df),
+                    # Count on the underlying numpy array instead of building
+                    # a boolean-masked copy of the DataFrame just for len()
+                    identified=int((result_df['sector'].to_numpy() != 'Unknown').sum())
+                )
                 
             except Exception as e:
-                jobs[job_id] = {'status': 'error', 'error': str(e)}
+                _update_job(job_id, status='error', error=str(e))
         
         # Start processing thread
         thread = threading.Thread(target=process_job)
@@ -1595,20 +1698,29 @@ def process_file():
 
 @app.route('/status/<job_id>')
 def job_status(job_id):
-    if job_id not in jobs:
-        return jsonify({'status': 'error', 'error': 'Job not found'})
-    
-    return jsonify(jobs[job_id])
+    with _JOBS_LOCK:
+        job = jobs.get(job_id)
+        if job is None:
+            return jsonify({'status': 'error', 'error': 'Job not found'})
+        return jsonify(dict(job))
 
 @app.route('/download/<job_id>')
 def download_result(job_id):
-    if job_id not in jobs or jobs[job_id]['status'] != 'completed':
+    if not _JOB_RE.match(job_id):
+        return "Invalid job id", 400
+    with _JOBS_LOCK:
+        job = dict(jobs.get(job_id) or {})
+    if job.get('status') != 'completed':
         return "File not ready", 404
-    
-    result_path = jobs[job_id]['result_path']
+
+    result_path = job['result_path']
     if os.path.exists(result_path):
-        return send_file(result_path, as_attachment=True, 
-                        download_name=f"email_company_results.xlsx")
+        # send_from_directory with conditional=True lets the WSGI server use
+        # kernel sendfile / range requests instead of copying through Python
+        return send_from_directory(OUTPUT_FOLDER, os.path.basename(result_path),
+                                   as_attachment=True,
+                                   download_name="email_company_results.xlsx",
+                                   conditional=True, max_age=0)
     else:
         return "File not found", 404
 
@@ -1616,5 +1728,15 @@ if __name__ == '__main__':
     print("🚀 Starting Email Company Tool Web Interface")
     print("🌐 Open your browser to: http://127.0.0.1:5000")
     print("✅ Ready to process email files!")
-    
-    app.run(host='127.0.0.1', port=5000, debug=False)
\ No newline at end of file
+
+    if os.environ.get('FLASK_DEBUG'):
+        # Werkzeug dev server only for debugging
+        app.run(host='127.0.0.1', port=5000, debug=True)
+    else:
+        try:
+            # Production WSGI server: the single-threaded dev server would
+            # block /status polling behind large uploads
+            from waitress import serve
+            serve(app, host='127.0.0.1', port=5000, threads=8, channel_timeout=600)
+        except ImportError:
+            app.run(host='127.0.0.1', port=5000, debug=False)
\ No newline at end of file
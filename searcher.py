@@ -11,7 +11,14 @@ import re
 import time
 import csv
 import sqlite3
-from threading import Lock
+import queue
+import atexit
+import pickle
+import hashlib
+import functools
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Thread, Event, local
 import asyncio
 import logging
 
@@ -35,6 +42,22 @@ try:
 except Exception:
     HAS_ASYNC = False
 
+# selectolax is a C HTML parser, much faster than BeautifulSoup's
+# html.parser on large homepages; fall back to BS4 when absent
+try:
+    from selectolax.parser import HTMLParser as _HTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# pyahocorasick gives a single linear scan over text for multi-keyword
+# lookups; a combined regex alternation stands in when it is absent
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
 # Load configurable sector rules from Dataset/sector_rules.json if present
 import json
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -53,25 +76,62 @@ CSV_CACHE_FILE = os.path.join(BASE_DIR, "Dataset", "search_cache.csv")
 # SQLite cache (domain -> company, sector)
 DB_CACHE_FILE = os.path.join(BASE_DIR, "Dataset", "search_cache.db")
 
-# in-memory per-host last request timestamps (not persisted)
+# in-memory per-host last request timestamps (not persisted); locks are
+# sharded by host so waiting on one host never blocks requests to others
 _host_last_request = {}
-_host_lock = Lock()
+_host_locks = defaultdict(Lock)
+_host_locks_guard = Lock()
+
+
+# schema creation runs exactly once per process; readers keep a
+# thread-local connection instead of re-opening (and re-parsing the DDL)
+# on every lookup
+_db_ready = Event()
+_db_init_lock = Lock()
+_read_local = local()
 
 
 def _ensure_db():
-    os.makedirs(os.path.dirname(DB_CACHE_FILE), exist_ok=True)
-    conn = sqlite3.connect(DB_CACHE_FILE)
-    cur = conn.cursor()
-    cur.execute('''
-        CREATE TABLE IF NOT EXISTS cache (
-            domain TEXT PRIMARY KEY,
-            company TEXT,
-            sector TEXT,
-            last_seen INTEGER
-        )
-    ''')
-    conn.commit()
-    conn.close()
+    if _db_ready.is_set():
+        return
+    with _db_init_lock:
+        if _db_ready.is_set():
+            return
+        os.makedirs(os.path.dirname(DB_CACHE_FILE), exist_ok=True)
+        conn = sqlite3.connect(DB_CACHE_FILE)
+        # WAL is a property of the database file: enabling it here means
+        # every later connection (readers included) sees it, and readers
+        # get consistent snapshots without blocking the batched writer
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS cache (
+                domain TEXT PRIMARY KEY,
+                company TEXT,
+                sector TEXT,
+                last_seen INTEGER
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS query_stats (
+                template TEXT PRIMARY KEY,
+                hits INTEGER DEFAULT 0
+            )
+        ''')
+        conn.commit()
+        conn.close()
+        _db_ready.set()
+
+
+def _read_conn():
+    """Per-thread read connection; reuses the connection's statement cache."""
+    conn = getattr(_read_local, 'conn', None)
+    if conn is None:
+        _ensure_db()
+        conn = sqlite3.connect(DB_CACHE_FILE)
+        conn.execute('PRAGMA busy_timeout=5000')
+        _read_local.conn = conn
+    return conn
 
 # Try to import requests and bs4, otherwise mark as unavailable
 try:
@@ -82,37 +142,158 @@ except Exception:
     HAS_REQUESTS = False
     from urllib import request as urllib_request
 
+# one pooled session for sync homepage fetches: keep-alive across same-host
+# requests saves the TCP+TLS setup that otherwise dominates fetch time
+if HAS_REQUESTS:
+    from requests.adapters import HTTPAdapter
+    _SESSION = requests.Session()
+    _adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+    _SESSION.mount('https://', _adapter)
+    _SESSION.mount('http://', _adapter)
+else:
+    _SESSION = None
+
+# requests-cache (optional) persists GET responses on disk so repeat
+# Wikidata/DDG lookups — across runs too — never touch the network.
+# Either way the lookup session keeps its own pooled adapter with urllib3
+# retries: Wikidata's multi-request lookups reuse one TLS connection
+# (saving a handshake per extra call) and transient 5xx/connection errors
+# retry with backoff, unlike homepage fetches where error_recovery
+# already owns retry policy.
+if HAS_REQUESTS:
+    from urllib3.util.retry import Retry
+    _lookup_adapter = HTTPAdapter(
+        pool_connections=20, pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.3,
+                          status_forcelist=(500, 502, 503, 504)))
+    try:
+        import requests_cache
+        _CACHED_SESSION = requests_cache.CachedSession(
+            os.path.join(BASE_DIR, 'Dataset', 'http_cache.sqlite'),
+            expire_after=86400, allowable_methods=('GET',))
+    except ImportError:
+        _CACHED_SESSION = requests.Session()
+    _CACHED_SESSION.mount('https://', _lookup_adapter)
+    _CACHED_SESSION.mount('http://', _lookup_adapter)
+else:
+    _CACHED_SESSION = None
 
-def _save_cache_row(domain, company, sector):
-    # write to sqlite cache
-    _ensure_db()
-    conn = sqlite3.connect(DB_CACHE_FILE)
-    cur = conn.cursor()
-    cur.execute('REPLACE INTO cache(domain, company, sector, last_seen) VALUES (?, ?, ?, ?)',
-                (domain, company, sector, int(time.time())))
-    conn.commit()
+
+# ----------------------
+# Batched cache writer
+# ----------------------
+# Per-row connect/REPLACE/commit/close serialized every resolver worker on
+# connection setup and fsync. Instead, rows are queued and a background
+# thread flushes batches in a single transaction over one WAL-mode
+# connection.
+_WRITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA busy_timeout=5000',
+    'PRAGMA temp_store=MEMORY',
+)
+_WRITE_BATCH = 500
+_WRITE_FLUSH_INTERVAL = 0.1  # seconds to wait for more rows before flushing
+_write_queue = queue.Queue()
+_writer_thread = None
+_writer_lock = Lock()
+
+
+def _writer_loop(conn):
+    while True:
+        item = _write_queue.get()
+        rows = []
+        if item is not None:
+            rows.append(item)
+            # drain up to a batch or until the queue goes briefly idle
+            deadline = time.time() + _WRITE_FLUSH_INTERVAL
+            while len(rows) < _WRITE_BATCH:
+                try:
+                    nxt = _write_queue.get(timeout=max(0.0, deadline - time.time()))
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    item = None
+                    break
+                rows.append(nxt)
+        if rows:
+            try:
+                with conn:
+                    conn.executemany(
+                        'REPLACE INTO cache(domain, company, sector, last_seen) VALUES (?, ?, ?, ?)',
+                        rows)
+            except Exception as e:
+                logger.warning(f"Cache batch write failed: {e}")
+        if item is None:
+            break
     conn.close()
-    # also append to CSV cache for compatibility/backups, but avoid duplicates
-    os.makedirs(os.path.dirname(CSV_CACHE_FILE), exist_ok=True)
-    # only append to CSV if domain not present in sqlite DB (prevents duplicates)
-    existing = _get_cache(domain)
-    if existing is None:
-        write_header = not os.path.exists(CSV_CACHE_FILE)
-        with open(CSV_CACHE_FILE, "a", newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            if write_header:
-                writer.writerow(["domain", "company", "sector"])
-            writer.writerow([domain, company, sector])
+
+
+def _start_writer():
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _ensure_db()
+            conn = sqlite3.connect(DB_CACHE_FILE, check_same_thread=False)
+            for pragma in _WRITE_PRAGMAS:
+                conn.execute(pragma)
+            _writer_thread = Thread(target=_writer_loop, args=(conn,), daemon=True)
+            _writer_thread.start()
+
+
+def _flush_writer():
+    # drain pending rows at interpreter exit so no resolve results are lost
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is not None:
+            _write_queue.put(None)
+            _writer_thread.join(timeout=5)
+            _writer_thread = None
+
+
+atexit.register(_flush_writer)
+
+
+def _save_cache_row(domain, company, sector):
+    # queue the row for the batched writer instead of opening a fresh
+    # connection and committing per row; the CSV backup is no longer
+    # mirrored here — call export_cache_to_csv() when one is needed
+    _start_writer()
+    _write_queue.put((domain, company, sector, int(time.time())))
+    _MEM_CACHE[domain] = (company, sector)
+
+
+def export_cache_to_csv(path=None):
+    """Write the whole sqlite cache out as a CSV backup. Returns row count."""
+    path = path or CSV_CACHE_FILE
+    _flush_writer()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    rows = _read_conn().execute('SELECT domain, company, sector FROM cache').fetchall()
+    with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(['domain', 'company', 'sector'])
+        writer.writerows(rows)
+    return len(rows)
+
+
+# in-process cache mirror so resolve passes skip SQLite on repeat lookups
+_MEM_CACHE = {}
+_mem_cache_loaded = False
+_mem_cache_lock = Lock()
+
+
+def _load_mem_cache():
+    """Populate the in-process cache dict from disk once."""
+    global _mem_cache_loaded
+    with _mem_cache_lock:
+        if not _mem_cache_loaded:
+            _MEM_CACHE.update(_read_cache())
+            _mem_cache_loaded = True
 
 
 def _read_cache():
     # read from sqlite cache if present, else csv cache
-    _ensure_db()
-    conn = sqlite3.connect(DB_CACHE_FILE)
-    cur = conn.cursor()
-    cur.execute('SELECT domain, company, sector FROM cache')
-    rows = cur.fetchall()
-    conn.close()
+    rows = _read_conn().execute('SELECT domain, company, sector FROM cache').fetchall()
     cache = {r[0]: (r[1] or 'Unknown', r[2] or 'Unknown') for r in rows}
     # fallback: if DB empty and CSV exists, read CSV
     if not cache and os.path.exists(CSV_CACHE_FILE):
@@ -124,12 +305,8 @@ def _read_cache():
 
 
 def _get_cache(domain):
-    _ensure_db()
-    conn = sqlite3.connect(DB_CACHE_FILE)
-    cur = conn.cursor()
-    cur.execute('SELECT company, sector FROM cache WHERE domain = ?', (domain,))
-    r = cur.fetchone()
-    conn.close()
+    r = _read_conn().execute('SELECT company, sector FROM cache WHERE domain = ?',
+                             (domain,)).fetchone()
     if r:
         return (r[0] or 'Unknown', r[1] or 'Unknown')
     return None
@@ -141,23 +318,26 @@ def import_csv_to_db(csv_path=None):
     if not os.path.exists(csv_path):
         return 0
     _ensure_db()
+    now = int(time.time())
     imported = 0
-    conn = sqlite3.connect(DB_CACHE_FILE)
-    cur = conn.cursor()
-    with open(csv_path, newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+
+    def _iter_rows(reader):
+        nonlocal imported
         for r in reader:
-            domain = r.get('domain')
-            company = r.get('company') or 'Unknown'
-            sector = r.get('sector') or 'Unknown'
-            try:
-                cur.execute('REPLACE INTO cache(domain, company, sector, last_seen) VALUES (?, ?, ?, ?)',
-                            (domain, company, sector, int(time.time())))
-                imported += 1
-            except Exception:
-                continue
-    conn.commit()
-    conn.close()
+            yield (r.get('domain'), r.get('company') or 'Unknown',
+                   r.get('sector') or 'Unknown', now)
+            imported += 1
+
+    conn = sqlite3.connect(DB_CACHE_FILE)
+    try:
+        with open(csv_path, newline='', encoding='utf-8', buffering=1 << 20) as f:
+            # one transaction + one prepared statement for the whole file
+            with conn:
+                conn.executemany(
+                    'REPLACE INTO cache(domain, company, sector, last_seen) VALUES (?, ?, ?, ?)',
+                    _iter_rows(csv.DictReader(f)))
+    finally:
+        conn.close()
     return imported
 
 
@@ -173,26 +353,31 @@ def clean_csv_cache(csv_path=None, backup=True):
         import shutil, datetime
         bak = csv_path + ".bak." + datetime.datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
         shutil.copy2(csv_path, bak)
+    # stream rows to a temp file keeping only the seen-domain set in memory,
+    # then atomically replace the original
     seen = set()
-    rows = []
-    with open(csv_path, newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            d = r.get('domain')
-            if not d:
-                continue
-            if d in seen:
-                continue
-            seen.add(d)
-            rows.append((d, r.get('company', 'Unknown'), r.get('sector', 'Unknown')))
-
-    # rewrite CSV with header
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
+    written = 0
+    tmp_path = csv_path + '.tmp'
+    with open(csv_path, newline='', encoding='utf-8', buffering=1 << 20) as src, \
+            open(tmp_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as dst:
+        reader = csv.DictReader(src)
+        writer = csv.writer(dst)
         writer.writerow(['domain', 'company', 'sector'])
-        for r in rows:
-            writer.writerow(r)
-    return len(rows)
+
+        def _unique_rows():
+            nonlocal written
+            for r in reader:
+                d = r.get('domain')
+                if not d or d in seen:
+                    continue
+                seen.add(d)
+                written += 1
+                yield (d, r.get('company', 'Unknown'), r.get('sector', 'Unknown'))
+
+        # writerows drives the generator from C instead of a Python loop
+        writer.writerows(_unique_rows())
+    os.replace(tmp_path, csv_path)
+    return written
 
 
 def save_cache(domain, company, sector):
@@ -202,15 +387,17 @@ def save_cache(domain, company, sector):
 
 def _set_host_wait(host, min_delay):
     # ensure at least min_delay seconds between requests to the same host
-    with _host_lock:
+    with _host_locks_guard:
+        lock = _host_locks[host]
+    with lock:
         last = _host_last_request.get(host)
-        now = time.time()
+        now = time.monotonic()
         if last is not None:
             wait = min_delay - (now - last)
             if wait > 0:
                 logger.debug(f"Rate limiting: waiting {wait:.2f}s for {host}")
                 time.sleep(wait)
-        _host_last_request[host] = time.time()
+        _host_last_request[host] = time.monotonic()
 
 
 # ----------------------
@@ -248,76 +435,87 @@ async def async_fetch_homepage(session, domain):
     retry_config=RetryConfig(max_attempts=3, base_delay=0.5, max_delay=10.0),
     track_metrics=True
 ) if HAS_ERROR_RECOVERY else lambda f: f
-async def async_search_domain(domain, pause=0.0, min_delay=0.0, session=None, db_path=None):
+async def async_search_domain(domain, pause=0.0, min_delay=0.0, session=None, db=None):
     logger.info(f"Starting async search for domain: {domain}")
-    
-    # try sqlite cache first (aiosqlite)
-    if HAS_ASYNC and db_path:
+
+    # in-process dict first, the shared aiosqlite connection only on miss
+    cached = _MEM_CACHE.get(domain)
+    if cached:
+        logger.debug(f"Memory cache hit for {domain}: {cached[0]}, {cached[1]}")
+        if HAS_ERROR_RECOVERY:
+            metrics_collector.record_cache_hit()
+        return cached
+    if db is not None:
         try:
-            async with aiosqlite.connect(db_path) as db:
-                cur = await db.execute('SELECT company, sector FROM cache WHERE domain = ?', (domain,))
-                row = await cur.fetchone()
-                await cur.close()
-                if row:
-                    logger.debug(f"Cache hit for {domain}: {row[0]}, {row[1]}")
-                    if HAS_ERROR_RECOVERY:
-                        metrics_collector.record_cache_hit()
-                    return (row[0] or 'Unknown', row[1] or 'Unknown')
+            cur = await db.execute('SELECT company, sector FROM cache WHERE domain = ?', (domain,))
+            row = await cur.fetchone()
+            await cur.close()
+            if row:
+                logger.debug(f"Cache hit for {domain}: {row[0]}, {row[1]}")
+                if HAS_ERROR_RECOVERY:
+                    metrics_collector.record_cache_hit()
+                _MEM_CACHE[domain] = (row[0] or 'Unknown', row[1] or 'Unknown')
+                return _MEM_CACHE[domain]
         except Exception as e:
             logger.warning(f"Cache lookup failed for {domain}: {e}")
     
     if HAS_ERROR_RECOVERY:
         metrics_collector.record_cache_miss()
 
-    # duckduckgo search (sync fallback)
+    # DDG search and the homepage fetch are independent network calls, so
+    # overlap them: wall clock per domain becomes ~max(RTTs) instead of sum
     logger.debug(f"Performing DuckDuckGo search for {domain}")
-    results = duckduckgo_search(domain, max_results=3)
+    if session:
+        results, (homepage_url, homepage_html) = await asyncio.gather(
+            async_duckduckgo_search(session, domain, max_results=3),
+            async_fetch_homepage(session, domain))
+    else:
+        # sync helper sleeps between retries; keep it off the event loop
+        results = await asyncio.to_thread(duckduckgo_search, domain, 3)
+        homepage_url = homepage_html = None
     candidate_name = None
-    candidate_text = ''
-    homepage_url = None
-    homepage_html = None
 
     for title, url in results:
-        parsed = urlparse(url)
-        netloc = parsed.netloc
-        if domain in netloc:
+        if domain in _netloc(url):
             candidate_name = title
-            if session:
-                homepage_url, homepage_html = await async_fetch_homepage(session, domain)
             break
 
-    if not homepage_html and session:
-        homepage_url, homepage_html = await async_fetch_homepage(session, domain)
-
     if homepage_html:
         candidate = extract_company_from_html(homepage_html, homepage_url)
         if candidate:
             candidate_name = candidate
-        candidate_text = homepage_html
 
     if not candidate_name and results:
         candidate_name = results[0][0]
 
-    sector = infer_sector_from_text(candidate_text or (candidate_name or ''))
+    sector = infer_sector_from_text(
+        _prepare_inference_text(homepage_html or ''),
+        candidate_name or '')
     
-    # If sector is still Unknown, try WikiData lookup
+    # If sector is still Unknown, try WikiData lookup (requests-based, so
+    # run it in a worker thread rather than blocking the loop)
     if sector == 'Unknown' and candidate_name:
         try:
-            wiki_sector = wikidata_lookup_company(candidate_name)
+            wiki_sector = await asyncio.to_thread(wikidata_lookup_company, candidate_name)
             if wiki_sector and wiki_sector != 'Unknown':
                 sector = wiki_sector
         except Exception:
             pass  # Continue with Unknown
     
     company = candidate_name or domain.split('.')[0].capitalize()
+    _MEM_CACHE[domain] = (company, sector)
 
-    # write to sqlite cache asynchronously if available
-    if HAS_ASYNC and db_path:
+    # write through the shared connection; commits are batched so a burst
+    # of resolves pays for one fsync instead of one per row
+    global _async_pending_writes
+    if db is not None:
         try:
-            async with aiosqlite.connect(db_path) as db:
-                await db.execute('REPLACE INTO cache(domain, company, sector, last_seen) VALUES (?, ?, ?, ?)',
-                                 (domain, company, sector, int(time.time())))
+            await db.execute('REPLACE INTO cache(domain, company, sector, last_seen) VALUES (?, ?, ?, ?)',
+                             (domain, company, sector, int(time.time())))
+            _async_pending_writes += 1
+            if _async_pending_writes >= _ASYNC_COMMIT_EVERY:
                 await db.commit()
+                _async_pending_writes = 0
         except Exception:
             pass
 
@@ -326,61 +524,208 @@ async def async_search_domain(domain, pause=0.0, min_delay=0.0, session=None, db
     return company, sector
 
 
+# domains currently being resolved, so overlapping passes await the same
+# future instead of hitting DDG twice (keyed on (loop, future) because a
+# future can only be awaited from its own loop)
+_inflight = {}
+
+# writes on the shared async connection are committed every K rows
+_ASYNC_COMMIT_EVERY = 50
+_async_pending_writes = 0
+
+
 async def async_resolve_domains(domains, workers=10, min_delay=0.2):
     if not HAS_ASYNC:
         raise RuntimeError('Async dependencies (aiohttp/aiosqlite) not installed')
+    global _async_pending_writes
     results = {}
+    _load_mem_cache()
+    _ensure_db()
+    loop = asyncio.get_running_loop()
     sem = asyncio.Semaphore(workers)
-    async with aiohttp.ClientSession() as session:
-        async def worker(domain):
-            async with sem:
-                return await async_search_domain(domain, pause=0.0, min_delay=min_delay, session=session, db_path=DB_CACHE_FILE)
-
-        tasks = [asyncio.create_task(worker(d)) for d in domains]
-        for d, t in zip(domains, tasks):
-            try:
-                res = await t
-            except Exception:
-                res = ('Unknown', 'Unknown')
-            results[d] = res
+    # one tuned connector for the whole pass: keep-alive + DNS cache avoid
+    # repeat TLS handshakes and lookups across DDG and homepage fetches
+    connector = aiohttp.TCPConnector(limit=2 * workers, limit_per_host=4,
+                                     ttl_dns_cache=300, enable_cleanup_closed=True)
+    # one shared aiosqlite connection for the whole pass instead of a fresh
+    # connect (and its worker thread) per domain
+    db = await aiosqlite.connect(DB_CACHE_FILE)
+    try:
+        for pragma in _WRITE_PRAGMAS:
+            await db.execute(pragma)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def worker(domain):
+                inflight = _inflight.get(domain)
+                if inflight is not None and inflight[0] is loop:
+                    return await inflight[1]
+                fut = loop.create_future()
+                _inflight[domain] = (loop, fut)
+                try:
+                    async with sem:
+                        res = await async_search_domain(domain, pause=0.0, min_delay=min_delay, session=session, db=db)
+                except Exception:
+                    res = ('Unknown', 'Unknown')
+                fut.set_result(res)
+                _inflight.pop(domain, None)
+                return res
+
+            # duplicates are common when domains come from per-email lists;
+            # resolve each one exactly once
+            uniq = list(dict.fromkeys(domains))
+            tasks = [asyncio.create_task(worker(d)) for d in uniq]
+            for d, t in zip(uniq, tasks):
+                results[d] = await t
+    finally:
+        try:
+            await db.commit()
+            _async_pending_writes = 0
+        except Exception:
+            pass
+        await db.close()
     return results
 
 
-def duckduckgo_search(query, max_results=5):
-    """Enhanced DuckDuckGo search with better resilience and user agents."""
-    results = []
+# Precompiled patterns for the hot parsing/cleaning paths; compiling these
+# per call shows up once thousands of domains go through a resolve pass
+# single alternation so the fallback parser scans the page once instead of
+# once per layout pattern
+_COMBINED_RESULT_RX = re.compile(
+    r'(?:<a[^>]+class="result__a"[^>]+href="(?P<h1>[^\"]+)"[^>]*>(?P<t1>.*?)</a>)|'
+    r'(?:<a[^>]+href="(?P<h2>[^\"]+)"[^>]*class="[^"]*result[^"]*"[^>]*>(?P<t2>.*?)</a>)|'
+    r'(?:<h3[^>]*><a[^>]+href="(?P<h3>[^\"]+)"[^>]*>(?P<t3>.*?)</a></h3>)',
+    re.I | re.S)
+_META_FALLBACK_PATTERNS = tuple(re.compile(p, re.I | re.S) for p in [
+    r'<meta[^>]+(?:property="og:site_name"|name="application-name")[^>]+content="([^"]+)"',
+    r'<title[^>]*>([^<]+)</title>',
+    r'<h1[^>]*>([^<]+)</h1>',
+])
+# combined into a single alternation so each candidate is scanned once
+# instead of once per pattern
+_CLEAN_COMBINED = re.compile('|'.join(f'(?:{p})' for p in [
+    r'\s*-\s*(?:Official Site|Home|Website|Company|Inc|LLC|Corp|Ltd).*$',
+    r'^(?:Welcome to|About|The)\s+',
+    r'\s*\|\s*.*$',  # Everything after pipe
+    r'\s*-\s*.*$',   # Everything after dash (less aggressive)
+    r'\s*&[^;]+;',   # HTML entities
+    r'^\s*Home\s*$', # Just "Home"
+    r'^\s*Index\s*$' # Just "Index"
+]), re.I)
+_STRIP_TAGS = re.compile('<[^<]+?>')
+_HAS_ALPHA = re.compile(r'[a-zA-Z]')
+# cheap netloc extraction for hot loops; urlparse allocates a ParseResult
+# per call which adds up across every search result
+_NETLOC_RX = re.compile(r'^(?:https?://)?([^/?#]+)', re.I)
+
+
+def _netloc(url):
+    m = _NETLOC_RX.match(url)
+    return m.group(1) if m else ''
+
+
+_SCRIPT_STYLE_RX = re.compile(r'<(script|style)\b.*?</\1>', re.I | re.S)
+# Sector inference is linear in text length; a homepage rarely says
+# anything new about its sector after the first ~50KB of visible text
+_INFER_TEXT_LIMIT = 50000
+
+
+def _prepare_inference_text(text):
+    """Strip script/style blocks and markup from homepage HTML and cap the
+    length, so per-call inference cost stays bounded however large the
+    page is. Plain text passes through (truncated) unchanged."""
+    if not text:
+        return ''
+    if '<' in text:
+        text = _SCRIPT_STYLE_RX.sub(' ', text)
+        text = _STRIP_TAGS.sub(' ', text)
+    return text[:_INFER_TEXT_LIMIT]
+
+# Common non-company terms; exact matches are O(1) set hits and only short
+# names pay for the substring scan
+_INVALID_EXACT = frozenset({
+    '404', 'error', 'not found', 'loading', 'please wait',
+    'home', 'index', 'welcome', 'login', 'sign in', 'menu',
+    'search', 'contact', 'about', 'services', 'products'
+})
+_INVALID_SUBSTRINGS = tuple(_INVALID_EXACT)
+
+
+# Shared by the sync and async DuckDuckGo paths
+_SEARCH_USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
+]
+
+
+def _search_headers(ua):
+    return {
+        "User-Agent": ua,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": "gzip, deflate",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    }
+
+
+def _search_urls(query):
     q = quote_plus(query)
-    
-    # Try multiple search endpoints and user agents
-    search_urls = [
+    return [
         f"https://duckduckgo.com/html/?q={q}",
         f"https://lite.duckduckgo.com/lite/?q={q}",
     ]
-    
-    user_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0"
-    ]
-    
+
+
+async def async_duckduckgo_search(session, query, max_results=5):
+    """DuckDuckGo search over the shared aiohttp session (no blocking I/O)."""
     import random
-    
-    for url in search_urls:
-        for ua in user_agents[:2]:  # Try first 2 user agents per URL
-            headers = {
-                "User-Agent": ua,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-            
+
+    for url in _search_urls(query):
+        for ua in _SEARCH_USER_AGENTS[:2]:  # Try first 2 user agents per URL
+            try:
+                async with session.get(url, headers=_search_headers(ua), timeout=15) as resp:
+                    resp.raise_for_status()
+                    html = await resp.text()
+
+                # Check if we got blocked
+                if "blocked" in html.lower() or "captcha" in html.lower():
+                    logger.warning(f"Search blocked for {query}, trying different approach")
+                    await asyncio.sleep(random.uniform(1, 3))
+                    continue
+
+                if html:
+                    parsed_results = parse_search_results(html)
+                    if parsed_results:
+                        return parsed_results[:max_results]
+
+            except Exception as e:
+                logger.debug(f"Search attempt failed with {ua[:20]}...: {e}")
+                await asyncio.sleep(random.uniform(0.5, 1.5))
+                continue
+
+    logger.warning(f"All search attempts failed for query: {query}")
+    return []
+
+
+@functools.lru_cache(maxsize=1024)
+def duckduckgo_search(query, max_results=5):
+    """Enhanced DuckDuckGo search with better resilience and user agents.
+    Memoized per query: the multi-query fan-out in search_domain often
+    repeats queries across similar domains.
+    """
+    results = []
+
+    import random
+
+    for url in _search_urls(query):
+        for ua in _SEARCH_USER_AGENTS[:2]:  # Try first 2 user agents per URL
+            headers = _search_headers(ua)
+
             try:
                 if HAS_REQUESTS:
-                    resp = requests.get(url, headers=headers, timeout=15)
+                    resp = _CACHED_SESSION.get(url, headers=headers, timeout=15)
                     resp.raise_for_status()
                     html = resp.text
                     
@@ -414,12 +759,23 @@ def parse_search_results(html):
     """Parse search results from HTML."""
     results = []
 
+    # Try multiple selectors for different DuckDuckGo layouts
+    selectors = ['a.result__a', 'a[class*="result"]', '.result-title a', 'h3 a']
+
     # Parse HTML to find result links
-    if HAS_REQUESTS:
+    if HAS_SELECTOLAX:
+        tree = _HTMLParser(html)
+        for selector in selectors:
+            links = tree.css(selector)
+            if links:
+                for a in links[:10]:  # Limit to prevent too many results
+                    title = a.text(strip=True)
+                    href = a.attributes.get('href')
+                    if href and title and len(title) > 2:
+                        results.append((title, href))
+                break  # Use first successful selector
+    elif HAS_REQUESTS:
         soup = BeautifulSoup(html, 'html.parser')
-        # Try multiple selectors for different DuckDuckGo layouts
-        selectors = ['a.result__a', 'a[class*="result"]', '.result-title a', 'h3 a']
-        
         for selector in selectors:
             links = soup.select(selector)
             if links:
@@ -430,21 +786,15 @@ def parse_search_results(html):
                         results.append((title, href))
                 break  # Use first successful selector
     else:
-        # Enhanced regex fallback for different link patterns
-        patterns = [
-            r'<a[^>]+class="result__a"[^>]+href="(?P<h>[^\"]+)"[^>]*>(?P<t>.*?)</a>',
-            r'<a[^>]+href="(?P<h>[^\"]+)"[^>]*class="[^"]*result[^"]*"[^>]*>(?P<t>.*?)</a>',
-            r'<h3[^>]*><a[^>]+href="(?P<h>[^\"]+)"[^>]*>(?P<t>.*?)</a></h3>'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, html, re.I | re.S)
-            if matches:
-                for href, title in matches[:10]:
-                    clean_title = re.sub('<[^<]+?>', '', title).strip()
-                    if clean_title and len(clean_title) > 2:
-                        results.append((clean_title, href))
-                break  # Use first successful pattern
+        # Enhanced regex fallback: one combined alternation, one page scan
+        for m in _COMBINED_RESULT_RX.finditer(html):
+            href = m.group('h1') or m.group('h2') or m.group('h3')
+            title = m.group('t1') or m.group('t2') or m.group('t3')
+            clean_title = _STRIP_TAGS.sub('', title or '').strip()
+            if href and clean_title and len(clean_title) > 2:
+                results.append((clean_title, href))
+                if len(results) >= 10:  # Limit to prevent too many results
+                    break
 
     return results
 
@@ -488,14 +838,16 @@ def fetch_homepage(domain):
                 # Add small random delay to appear more human-like
                 time.sleep(random.uniform(0.1, 0.3))
                 
-                resp = requests.get(
-                    url, 
-                    headers=headers, 
-                    timeout=12,
-                    allow_redirects=True,
-                    verify=False  # Skip SSL verification for some difficult sites
-                )
-                
+                try:
+                    resp = _SESSION.get(url, headers=headers, timeout=12,
+                                        allow_redirects=True)
+                except requests.exceptions.SSLError:
+                    # only drop verification as a second pass for this URL
+                    logger.debug(f"SSL error for {url}, retrying without verification")
+                    resp = _SESSION.get(url, headers=headers, timeout=12,
+                                        allow_redirects=True, verify=False)
+
+
                 # Check if response is valid
                 if resp.status_code == 200 and resp.text:
                     # Check if we got blocked or got a parking page
@@ -539,87 +891,148 @@ def fetch_homepage(domain):
 
 
 def extract_company_from_html(html, url=None):
-    """Enhanced company name extraction from HTML with better parsing."""
-    name_candidates = []
-    
-    if html and HAS_REQUESTS:
+    """Enhanced company name extraction from HTML with better parsing.
+
+    Priorities are evaluated as a cascade: once a tier yields a valid
+    cleaned candidate the cheaper answer wins and the remaining (more
+    expensive) selector tiers are skipped entirely.
+    """
+    # Priority 1: Meta tags (most reliable)
+    meta_props = [
+        'og:site_name', 'application-name', 'og:title',
+        'twitter:title', 'description', 'og:description'
+    ]
+    # Priority 3: Company-specific selectors
+    company_selectors = [
+        '.company-name', '.brand-name', '.logo-text',
+        '[class*="company"]', '[class*="brand"]',
+        'h1.title', 'h1.name', '.site-title'
+    ]
+    # Priority 5: Navigation links (often contain company name)
+    nav_selectors = ['nav a', '.navbar a', '.menu a', 'header a']
+
+    def _best(candidates):
+        cleaned = [c for c in map(clean_company_candidate, candidates)
+                   if c and is_valid_company_name(c)]
+        return score_company_names(cleaned) if cleaned else None
+
+    if html and HAS_SELECTOLAX:
+        tree = _HTMLParser(html)
+
+        tier = []
+        for prop in meta_props:
+            tag = (tree.css_first(f'meta[property="{prop}"]')
+                   or tree.css_first(f'meta[name="{prop}"]'))
+            if tag:
+                content = (tag.attributes.get('content') or '').strip()
+                if len(content) > 2:
+                    tier.append(content)
+        picked = _best(tier)
+        if picked:
+            return picked
+
+        # Priority 2: Title tag
+        title_node = tree.css_first('title')
+        if title_node:
+            picked = _best([title_node.text(strip=True)])
+            if picked:
+                return picked
+
+        tier = []
+        for selector in company_selectors:
+            for elem in tree.css(selector)[:2]:  # Limit to first 2 matches
+                text = elem.text(strip=True)
+                if text and len(text) > 1:
+                    tier.append(text)
+        picked = _best(tier)
+        if picked:
+            return picked
+
+        # Priority 4: Header tags
+        tier = []
+        for tag in ['h1', 'h2']:
+            for header in tree.css(tag)[:3]:
+                text = header.text(strip=True)
+                if text and len(text) > 1:
+                    tier.append(text)
+        picked = _best(tier)
+        if picked:
+            return picked
+
+        tier = []
+        for selector in nav_selectors:
+            for link in tree.css(selector)[:3]:
+                text = link.text(strip=True)
+                if text and len(text) > 1 and 'home' in text.lower():
+                    tier.append(text)
+        picked = _best(tier)
+        if picked:
+            return picked
+
+    elif html and HAS_REQUESTS:
         soup = BeautifulSoup(html, 'html.parser')
-        
-        # Priority 1: Meta tags (most reliable)
-        meta_props = [
-            'og:site_name', 'application-name', 'og:title', 
-            'twitter:title', 'description', 'og:description'
-        ]
+
+        tier = []
         for prop in meta_props:
             tag = soup.find('meta', property=prop) or soup.find('meta', attrs={'name': prop})
             if tag and tag.get('content'):
                 content = tag.get('content').strip()
                 if len(content) > 2:
-                    name_candidates.append(content)
-        
+                    tier.append(content)
+        picked = _best(tier)
+        if picked:
+            return picked
+
         # Priority 2: Title tag
         if soup.title and soup.title.string:
-            title = soup.title.string.strip()
-            if title:
-                name_candidates.append(title)
-        
-        # Priority 3: Company-specific selectors
-        company_selectors = [
-            '.company-name', '.brand-name', '.logo-text', 
-            '[class*="company"]', '[class*="brand"]',
-            'h1.title', 'h1.name', '.site-title'
-        ]
+            picked = _best([soup.title.string.strip()])
+            if picked:
+                return picked
+
+        tier = []
         for selector in company_selectors:
             elements = soup.select(selector)
             for elem in elements[:2]:  # Limit to first 2 matches
                 text = elem.get_text(strip=True)
                 if text and len(text) > 1:
-                    name_candidates.append(text)
-        
+                    tier.append(text)
+        picked = _best(tier)
+        if picked:
+            return picked
+
         # Priority 4: Header tags
+        tier = []
         for tag in ['h1', 'h2']:
             headers = soup.find_all(tag, limit=3)
             for header in headers:
                 text = header.get_text(strip=True)
                 if text and len(text) > 1:
-                    name_candidates.append(text)
-        
-        # Priority 5: Navigation links (often contain company name)
-        nav_selectors = ['nav a', '.navbar a', '.menu a', 'header a']
+                    tier.append(text)
+        picked = _best(tier)
+        if picked:
+            return picked
+
+        tier = []
         for selector in nav_selectors:
             links = soup.select(selector)
             for link in links[:3]:
                 text = link.get_text(strip=True)
                 if text and len(text) > 1 and 'home' in text.lower():
-                    name_candidates.append(text)
-    
+                    tier.append(text)
+        picked = _best(tier)
+        if picked:
+            return picked
+
     elif html:
         # Fallback parsing without BeautifulSoup
-        patterns = [
-            r'<meta[^>]+(?:property="og:site_name"|name="application-name")[^>]+content="([^"]+)"',
-            r'<title[^>]*>([^<]+)</title>',
-            r'<h1[^>]*>([^<]+)</h1>'
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, html, re.I | re.S)
-            for match in matches:
-                name_candidates.append(match.strip())
-
-    # Clean and score candidates
-    cleaned_candidates = []
-    for candidate in name_candidates:
-        cleaned = clean_company_candidate(candidate)
-        if cleaned and is_valid_company_name(cleaned):
-            cleaned_candidates.append(cleaned)
-    
-    # Return best candidate based on scoring
-    if cleaned_candidates:
-        return score_company_names(cleaned_candidates)
-    
+        for pattern in _META_FALLBACK_PATTERNS:
+            picked = _best([m.strip() for m in pattern.findall(html)])
+            if picked:
+                return picked
+
     # Ultimate fallback: derive from URL
     if url:
-        parsed = urlparse(url)
-        host = parsed.netloc.replace('www.', '')
+        host = _netloc(url).replace('www.', '')
         parts = host.split('.')
         if len(parts) >= 2:
             return parts[-2].capitalize()
@@ -632,19 +1045,12 @@ def clean_company_candidate(candidate):
     if not candidate:
         return None
     
-    # Remove common website suffixes and prefixes
-    patterns_to_remove = [
-        r'\s*-\s*(Official Site|Home|Website|Company|Inc|LLC|Corp|Ltd).*$',
-        r'^(Welcome to|About|The)\s+',
-        r'\s*\|\s*.*$',  # Everything after pipe
-        r'\s*-\s*.*$',   # Everything after dash (less aggressive)
-        r'\s*&[^;]+;',   # HTML entities
-        r'^\s*Home\s*$', # Just "Home"
-        r'^\s*Index\s*$' # Just "Index"
-    ]
-    
-    for pattern in patterns_to_remove:
-        candidate = re.sub(pattern, '', candidate, flags=re.I)
+    # Remove common website suffixes and prefixes; re-run until stable so
+    # anchored patterns still fire on text exposed by an earlier strip
+    prev = None
+    while candidate and candidate != prev:
+        prev = candidate
+        candidate = _CLEAN_COMBINED.sub('', candidate)
     
     # Clean up whitespace and return
     return ' '.join(candidate.split()).strip()
@@ -656,22 +1062,14 @@ def is_valid_company_name(name):
         return False
     
     # Reject common non-company terms
-    invalid_terms = [
-        '404', 'error', 'not found', 'loading', 'please wait',
-        'home', 'index', 'welcome', 'login', 'sign in', 'menu',
-        'search', 'contact', 'about', 'services', 'products'
-    ]
-    
     name_lower = name.lower()
-    for term in invalid_terms:
-        if name_lower == term or (len(name_lower) < 10 and term in name_lower):
-            return False
-    
-    # Must contain at least one letter
-    if not re.search(r'[a-zA-Z]', name):
+    if name_lower in _INVALID_EXACT:
         return False
-    
-    return True
+    if len(name_lower) < 10 and any(term in name_lower for term in _INVALID_SUBSTRINGS):
+        return False
+
+    # Must contain at least one letter
+    return bool(_HAS_ALPHA.search(name))
 
 
 def score_company_names(candidates):
@@ -682,315 +1080,481 @@ def score_company_names(candidates):
     if len(candidates) == 1:
         return candidates[0]
     
-    scored = []
+    # Single max pass; lowercase each candidate once
+    website_words = ('website', 'site', 'official', 'home', 'welcome')
+    best_score, best = -1, None
     for candidate in candidates:
+        lowered = candidate.lower()
         score = 0
-        
+
         # Prefer shorter, cleaner names
         if len(candidate) < 30:
             score += 2
         if len(candidate) < 15:
             score += 1
-        
+
         # Prefer names without common website words
-        website_words = ['website', 'site', 'official', 'home', 'welcome']
-        if not any(word in candidate.lower() for word in website_words):
+        if not any(word in lowered for word in website_words):
             score += 3
-        
+
         # Prefer capitalized names
         if candidate[0].isupper():
             score += 1
-        
+
         # Prefer names with proper capitalization
         if candidate.istitle() or any(c.isupper() for c in candidate[1:]):
             score += 1
-        
-        scored.append((score, candidate))
-    
-    # Return highest scored candidate
-    scored.sort(reverse=True, key=lambda x: x[0])
-    return scored[0][1]
-
 
-def infer_sector_from_text(text, sector_keywords=None):
-    """Enhanced sector inference with comprehensive keyword mapping and smart analysis."""
-    if not text:
+        if score > best_score:
+            best_score, best = score, candidate
+
+    return best
+
+
+# Comprehensive keyword mapping with priority scoring, built once at
+# import instead of per call
+_SECTOR_KEYWORDS = {
+    # Technology (highest priority for tech terms)
+    'software development': 'Technology',
+    'web development': 'Technology', 
+    'mobile app': 'Technology',
+    'artificial intelligence': 'Technology',
+    'machine learning': 'Technology',
+    'data science': 'Technology',
+    'cloud computing': 'Technology',
+    'cybersecurity': 'Technology',
+    'blockchain': 'Technology',
+    'cryptocurrency': 'Technology',
+    'saas': 'Technology',
+    'tech': 'Technology',
+    'software': 'Technology',
+    'technology': 'Technology',
+    'information technology': 'Technology',
+    'it services': 'Technology',
+    'internet': 'Technology',
+    'cloud': 'Technology',
+    'digital': 'Technology',
+    'platform': 'Technology',
+    'app': 'Technology',
+    'api': 'Technology',
+    'programming': 'Technology',
+    'coding': 'Technology',
+    'development': 'Technology',
+    
+    # Finance & Banking
+    'financial services': 'Finance',
+    'investment banking': 'Finance',
+    'wealth management': 'Finance',
+    'asset management': 'Finance',
+    'private equity': 'Finance',
+    'venture capital': 'Finance',
+    'cryptocurrency': 'Finance',
+    'fintech': 'Finance',
+    'banking': 'Finance',
+    'bank': 'Finance',
+    'finance': 'Finance',
+    'insurance': 'Finance',
+    'investment': 'Finance',
+    'fund': 'Finance',
+    'capital': 'Finance',
+    'trading': 'Finance',
+    'securities': 'Finance',
+    'credit': 'Finance',
+    'loan': 'Finance',
+    'mortgage': 'Finance',
+    'payment': 'Finance',
+    
+    # Healthcare & Medical
+    'healthcare services': 'Healthcare',
+    'medical device': 'Healthcare',
+    'pharmaceutical': 'Healthcare',
+    'biotechnology': 'Healthcare',
+    'health insurance': 'Healthcare',
+    'telemedicine': 'Healthcare',
+    'clinical': 'Healthcare',
+    'hospital': 'Healthcare',
+    'clinic': 'Healthcare',
+    'health': 'Healthcare',
+    'medical': 'Healthcare',
+    'pharma': 'Healthcare',
+    'biotech': 'Healthcare',
+    'medicine': 'Healthcare',
+    'patient': 'Healthcare',
+    'therapy': 'Healthcare',
+    'diagnostic': 'Healthcare',
+    
+    # E-commerce & Retail
+    'e-commerce platform': 'E-commerce',
+    'online retail': 'E-commerce',
+    'marketplace': 'E-commerce',
+    'e-commerce': 'E-commerce',
+    'ecommerce': 'E-commerce',
+    'online store': 'E-commerce',
+    'retail': 'Retail',
+    'store': 'Retail',
+    'shop': 'Retail',
+    'shopping': 'Retail',
+    'merchandise': 'Retail',
+    'consumer goods': 'Retail',
+    
+    # Manufacturing & Industrial
+    'manufacturing': 'Manufacturing',
+    'production': 'Manufacturing',
+    'factory': 'Manufacturing',
+    'industrial': 'Manufacturing',
+    'automotive': 'Manufacturing',
+    'aerospace': 'Manufacturing',
+    'chemical': 'Manufacturing',
+    'materials': 'Manufacturing',
+    'assembly': 'Manufacturing',
+    'supply chain': 'Manufacturing',
+    
+    # Consulting & Professional Services
+    'management consulting': 'Consulting',
+    'business consulting': 'Consulting',
+    'strategy consulting': 'Consulting',
+    'it consulting': 'Consulting',
+    'consulting': 'Consulting',
+    'advisory': 'Consulting',
+    'professional services': 'Consulting',
+    'legal services': 'Legal Services',
+    'law firm': 'Legal Services',
+    'attorney': 'Legal Services',
+    'lawyer': 'Legal Services',
+    
+    # Media & Entertainment
+    'media production': 'Media & Entertainment',
+    'content creation': 'Media & Entertainment',
+    'streaming': 'Media & Entertainment',
+    'broadcasting': 'Media & Entertainment',
+    'entertainment': 'Media & Entertainment',
+    'gaming': 'Media & Entertainment',
+    'publishing': 'Media & Entertainment',
+    'media': 'Media & Entertainment',
+    'news': 'Media & Entertainment',
+    'television': 'Media & Entertainment',
+    'radio': 'Media & Entertainment',
+    'film': 'Media & Entertainment',
+    'video': 'Media & Entertainment',
+    
+    # Education & Training
+    'educational technology': 'Education',
+    'online learning': 'Education',
+    'training': 'Education',
+    'education': 'Education',
+    'university': 'Education',
+    'school': 'Education',
+    'learning': 'Education',
+    'course': 'Education',
+    'academic': 'Education',
+    
+    # Real Estate
+    'real estate': 'Real Estate',
+    'property management': 'Real Estate',
+    'construction': 'Real Estate',
+    'architecture': 'Real Estate',
+    'property': 'Real Estate',
+    'building': 'Real Estate',
+    
+    # Transportation & Logistics
+    'logistics': 'Transportation & Logistics',
+    'supply chain': 'Transportation & Logistics',
+    'shipping': 'Transportation & Logistics',
+    'delivery': 'Transportation & Logistics',
+    'transport': 'Transportation & Logistics',
+    'freight': 'Transportation & Logistics',
+    'warehouse': 'Transportation & Logistics',
+    
+    # Hospitality & Travel
+    'hospitality': 'Hospitality & Travel',
+    'hotel': 'Hospitality & Travel',
+    'travel': 'Hospitality & Travel',
+    'tourism': 'Hospitality & Travel',
+    'restaurant': 'Food & Beverage',
+    'food service': 'Food & Beverage',
+    'catering': 'Food & Beverage',
+    
+    # Energy & Utilities
+    'renewable energy': 'Energy',
+    'solar energy': 'Energy',
+    'wind energy': 'Energy',
+    'oil and gas': 'Energy',
+    'utilities': 'Energy',
+    'energy': 'Energy',
+    'power': 'Energy',
+    'electricity': 'Energy',
+    'oil': 'Energy',
+    'gas': 'Energy',
+    'utility': 'Energy',
+    
+    # Telecommunications
+    'telecommunications': 'Telecommunications',
+    'telecom': 'Telecommunications',
+    'mobile': 'Telecommunications',
+    'wireless': 'Telecommunications',
+    'network': 'Telecommunications',
+    'internet service': 'Telecommunications',
+    
+    # Nonprofit & Government
+    'non-profit': 'Non-profit',
+    'nonprofit': 'Non-profit',
+    'charity': 'Non-profit',
+    'foundation': 'Non-profit',
+    'government': 'Government',
+    'public sector': 'Government',
+    
+    # Agriculture & Food
+    'agriculture': 'Agriculture',
+    'farming': 'Agriculture',
+    'food production': 'Agriculture',
+    'agribusiness': 'Agriculture',
+}
+
+
+# Direct company name -> sector mappings checked before keyword scoring
+_COMPANY_SECTORS = {
+    # Technology & Software
+    'gmail': 'Technology', 'google': 'Technology', 'apple': 'Technology',
+    'microsoft': 'Technology', 'facebook': 'Technology', 'meta': 'Technology',
+    'instagram': 'Technology', 'twitter': 'Technology', 'linkedin': 'Technology',
+    'github': 'Technology', 'adobe': 'Technology', 'oracle': 'Technology',
+    'salesforce': 'Technology', 'zoom': 'Technology', 'slack': 'Technology',
+    'dropbox': 'Technology', 'netflix': 'Media & Entertainment', 'spotify': 'Media & Entertainment',
+    'intel': 'Technology', 'nvidia': 'Technology', 'amd': 'Technology',
+    'ibm': 'Technology', 'hp': 'Technology', 'dell': 'Technology',
+
+    # E-commerce & Retail
+    'amazon': 'E-commerce', 'shopify': 'E-commerce', 'ebay': 'E-commerce',
+    'alibaba': 'E-commerce', 'walmart': 'Retail', 'target': 'Retail',
+
+    # Finance & Banking
+    'paypal': 'Finance', 'visa': 'Finance', 'mastercard': 'Finance',
+    'jpmorgan': 'Finance', 'goldman': 'Finance', 'citi': 'Finance',
+
+    # Transportation & Automotive
+    'uber': 'Transportation', 'tesla': 'Automotive', 'ford': 'Automotive',
+    'toyota': 'Automotive', 'bmw': 'Automotive', 'mercedes': 'Automotive',
+
+    # Hospitality & Travel
+    'airbnb': 'Hospitality', 'booking': 'Hospitality', 'expedia': 'Travel',
+    'marriott': 'Hospitality', 'hilton': 'Hospitality',
+
+    # Healthcare & Pharmaceutical
+    'pfizer': 'Healthcare', 'johnson': 'Healthcare', 'merck': 'Healthcare',
+    'novartis': 'Healthcare', 'roche': 'Healthcare',
+}
+
+def _load_or_build_automaton(cache_name, items):
+    """Load a pickled Aho-Corasick automaton from Dataset/, rebuilding and
+    re-persisting it when the cache is missing or its keyword set changed.
+    Short-lived CLI runs then skip automaton construction on start-up.
+    """
+    path = os.path.join(BASE_DIR, 'Dataset', cache_name)
+    fingerprint = hashlib.md5(repr(sorted(items)).encode()).hexdigest()
+    try:
+        with open(path, 'rb') as f:
+            cached_fp, automaton = pickle.load(f)
+        if cached_fp == fingerprint:
+            return automaton
+    except Exception:
+        pass
+    automaton = ahocorasick.Automaton()
+    for word, value in items:
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump((fingerprint, automaton), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        logger.debug(f"Could not persist automaton cache to {path}")
+    return automaton
+
+
+if HAS_AHOCORASICK:
+    _COMPANY_AUTOMATON = _load_or_build_automaton(
+        'company_ac.pkl',
+        [(c, (len(c), s)) for c, s in _COMPANY_SECTORS.items()])
+else:
+    _COMPANY_AUTOMATON = None
+    # longest alternatives first so the regex mirrors longest-match wins
+    _COMPANY_RX = re.compile('|'.join(
+        sorted(map(re.escape, _COMPANY_SECTORS), key=len, reverse=True)))
+
+# Phrase weights (longer phrases score higher) computed once at import
+_SECTOR_WEIGHTS = {k: len(k.split()) * 2 for k in _SECTOR_KEYWORDS}
+
+# Integer sector ids: the default-map scoring kernel accumulates into a
+# flat list indexed by id instead of hashing sector-name strings per hit
+_SECTOR_NAMES = tuple(dict.fromkeys(_SECTOR_KEYWORDS.values()))
+_SECTOR_IDS = {name: i for i, name in enumerate(_SECTOR_NAMES)}
+# keyword -> (weight, sector_id), shared by the automaton and the regex
+# fallback so both paths emit the same integer payloads
+_KEYWORD_INFO = {k: (_SECTOR_WEIGHTS[k], _SECTOR_IDS[s])
+                 for k, s in _SECTOR_KEYWORDS.items()}
+
+# Inverted word -> [(sector_id, delta)] index for the partial-word pass:
+# one dict lookup per unique word instead of splitting every keyword for
+# every word of the text
+_WORD_INDEX = defaultdict(list)
+for _kw, _sector in _SECTOR_KEYWORDS.items():
+    for _tok in set(_kw.split()):
+        _WORD_INDEX[_tok].append((_SECTOR_IDS[_sector], 0.5))
+_WORD_INDEX = dict(_WORD_INDEX)
+
+# Exact-phrase keyword scoring is the same multi-pattern problem: one
+# linear pass with Aho-Corasick (or a combined regex without it) instead
+# of ~170 substring scans per text
+if HAS_AHOCORASICK:
+    _KEYWORD_AUTOMATON = _load_or_build_automaton(
+        'sector_ac.pkl', list(_KEYWORD_INFO.items()))
+else:
+    _KEYWORD_AUTOMATON = None
+    _KEYWORD_RX = re.compile('|'.join(
+        sorted(map(re.escape, _SECTOR_KEYWORDS), key=len, reverse=True)))
+
+
+# Cache inference for short texts (titles, company names): the same names
+# recur constantly on real mail workloads, e.g. every @gmail.com address
+_INFER_CACHE_MAX_LEN = 512
+# Stop scoring once a sector reaches this: its lead is treated as
+# uncatchable, so long keyword-dense texts don't pay for a full scan
+_EARLY_EXIT_SCORE = 20.0
+
+
+def infer_sector_from_text(*text_chunks, sector_keywords=None):
+    """Enhanced sector inference with comprehensive keyword mapping and smart analysis.
+
+    Accepts any number of text chunks (homepage HTML, search titles,
+    candidate name, ...) and scores them independently through the same
+    keyword scan, so callers never have to concatenate large buffers.
+    """
+    chunks = [c.lower() for c in text_chunks if c]
+    if not chunks:
         return 'Unknown'
-    
-    text = text.lower()
-    
-    # First, check for direct company name mappings (expanded)
-    company_sectors = {
-        # Technology & Software
-        'gmail': 'Technology', 'google': 'Technology', 'apple': 'Technology', 
-        'microsoft': 'Technology', 'facebook': 'Technology', 'meta': 'Technology',
-        'instagram': 'Technology', 'twitter': 'Technology', 'linkedin': 'Technology',
-        'github': 'Technology', 'adobe': 'Technology', 'oracle': 'Technology',
-        'salesforce': 'Technology', 'zoom': 'Technology', 'slack': 'Technology',
-        'dropbox': 'Technology', 'netflix': 'Media & Entertainment', 'spotify': 'Media & Entertainment',
-        'intel': 'Technology', 'nvidia': 'Technology', 'amd': 'Technology',
-        'ibm': 'Technology', 'hp': 'Technology', 'dell': 'Technology',
-        
-        # E-commerce & Retail
-        'amazon': 'E-commerce', 'shopify': 'E-commerce', 'ebay': 'E-commerce',
-        'alibaba': 'E-commerce', 'walmart': 'Retail', 'target': 'Retail',
-        
-        # Finance & Banking
-        'paypal': 'Finance', 'visa': 'Finance', 'mastercard': 'Finance',
-        'jpmorgan': 'Finance', 'goldman': 'Finance', 'citi': 'Finance',
-        
-        # Transportation & Automotive
-        'uber': 'Transportation', 'tesla': 'Automotive', 'ford': 'Automotive',
-        'toyota': 'Automotive', 'bmw': 'Automotive', 'mercedes': 'Automotive',
-        
-        # Hospitality & Travel
-        'airbnb': 'Hospitality', 'booking': 'Hospitality', 'expedia': 'Travel',
-        'marriott': 'Hospitality', 'hilton': 'Hospitality',
-        
-        # Healthcare & Pharmaceutical
-        'pfizer': 'Healthcare', 'johnson': 'Healthcare', 'merck': 'Healthcare',
-        'novartis': 'Healthcare', 'roche': 'Healthcare',
-    }
-    
-    # Check if any company name is directly mentioned
-    for company, sector in company_sectors.items():
-        if company in text:
-            return sector
-    
+    if (sector_keywords is None and len(chunks) == 1
+            and len(chunks[0]) <= _INFER_CACHE_MAX_LEN):
+        return _infer_sector_cached(chunks[0])
+    return _infer_sector_impl(chunks, sector_keywords)
+
+
+@functools.lru_cache(maxsize=4096)
+def _infer_sector_cached(text):
+    return _infer_sector_impl([text], None)
+
+
+def _infer_sector_impl(chunks, sector_keywords):
+    # Check if any company name is directly mentioned: one linear scan over
+    # each chunk instead of one substring search per company
+    if _COMPANY_AUTOMATON is not None:
+        best = max((m for text in chunks for m in _COMPANY_AUTOMATON.iter(text)),
+                   key=lambda m: m[1][0], default=None)
+        if best:
+            return best[1][1]
+    else:
+        for text in chunks:
+            m = _COMPANY_RX.search(text)
+            if m:
+                return _COMPANY_SECTORS[m.group(0)]
+
     if sector_keywords is None:
-        # Comprehensive keyword mapping with priority scoring
-        sector_keywords = {
-            # Technology (highest priority for tech terms)
-            'software development': 'Technology',
-            'web development': 'Technology', 
-            'mobile app': 'Technology',
-            'artificial intelligence': 'Technology',
-            'machine learning': 'Technology',
-            'data science': 'Technology',
-            'cloud computing': 'Technology',
-            'cybersecurity': 'Technology',
-            'blockchain': 'Technology',
-            'cryptocurrency': 'Technology',
-            'saas': 'Technology',
-            'tech': 'Technology',
-            'software': 'Technology',
-            'technology': 'Technology',
-            'information technology': 'Technology',
-            'it services': 'Technology',
-            'internet': 'Technology',
-            'cloud': 'Technology',
-            'digital': 'Technology',
-            'platform': 'Technology',
-            'app': 'Technology',
-            'api': 'Technology',
-            'programming': 'Technology',
-            'coding': 'Technology',
-            'development': 'Technology',
-            
-            # Finance & Banking
-            'financial services': 'Finance',
-            'investment banking': 'Finance',
-            'wealth management': 'Finance',
-            'asset management': 'Finance',
-            'private equity': 'Finance',
-            'venture capital': 'Finance',
-            'cryptocurrency': 'Finance',
-            'fintech': 'Finance',
-            'banking': 'Finance',
-            'bank': 'Finance',
-            'finance': 'Finance',
-            'insurance': 'Finance',
-            'investment': 'Finance',
-            'fund': 'Finance',
-            'capital': 'Finance',
-            'trading': 'Finance',
-            'securities': 'Finance',
-            'credit': 'Finance',
-            'loan': 'Finance',
-            'mortgage': 'Finance',
-            'payment': 'Finance',
-            
-            # Healthcare & Medical
-            'healthcare services': 'Healthcare',
-            'medical device': 'Healthcare',
-            'pharmaceutical': 'Healthcare',
-            'biotechnology': 'Healthcare',
-            'health insurance': 'Healthcare',
-            'telemedicine': 'Healthcare',
-            'clinical': 'Healthcare',
-            'hospital': 'Healthcare',
-            'clinic': 'Healthcare',
-            'health': 'Healthcare',
-            'medical': 'Healthcare',
-            'pharma': 'Healthcare',
-            'biotech': 'Healthcare',
-            'medicine': 'Healthcare',
-            'patient': 'Healthcare',
-            'therapy': 'Healthcare',
-            'diagnostic': 'Healthcare',
-            
-            # E-commerce & Retail
-            'e-commerce platform': 'E-commerce',
-            'online retail': 'E-commerce',
-            'marketplace': 'E-commerce',
-            'e-commerce': 'E-commerce',
-            'ecommerce': 'E-commerce',
-            'online store': 'E-commerce',
-            'retail': 'Retail',
-            'store': 'Retail',
-            'shop': 'Retail',
-            'shopping': 'Retail',
-            'merchandise': 'Retail',
-            'consumer goods': 'Retail',
-            
-            # Manufacturing & Industrial
-            'manufacturing': 'Manufacturing',
-            'production': 'Manufacturing',
-            'factory': 'Manufacturing',
-            'industrial': 'Manufacturing',
-            'automotive': 'Manufacturing',
-            'aerospace': 'Manufacturing',
-            'chemical': 'Manufacturing',
-            'materials': 'Manufacturing',
-            'assembly': 'Manufacturing',
-            'supply chain': 'Manufacturing',
-            
-            # Consulting & Professional Services
-            'management consulting': 'Consulting',
-            'business consulting': 'Consulting',
-            'strategy consulting': 'Consulting',
-            'it consulting': 'Consulting',
-            'consulting': 'Consulting',
-            'advisory': 'Consulting',
-            'professional services': 'Consulting',
-            'legal services': 'Legal Services',
-            'law firm': 'Legal Services',
-            'attorney': 'Legal Services',
-            'lawyer': 'Legal Services',
-            
-            # Media & Entertainment
-            'media production': 'Media & Entertainment',
-            'content creation': 'Media & Entertainment',
-            'streaming': 'Media & Entertainment',
-            'broadcasting': 'Media & Entertainment',
-            'entertainment': 'Media & Entertainment',
-            'gaming': 'Media & Entertainment',
-            'publishing': 'Media & Entertainment',
-            'media': 'Media & Entertainment',
-            'news': 'Media & Entertainment',
-            'television': 'Media & Entertainment',
-            'radio': 'Media & Entertainment',
-            'film': 'Media & Entertainment',
-            'video': 'Media & Entertainment',
-            
-            # Education & Training
-            'educational technology': 'Education',
-            'online learning': 'Education',
-            'training': 'Education',
-            'education': 'Education',
-            'university': 'Education',
-            'school': 'Education',
-            'learning': 'Education',
-            'course': 'Education',
-            'academic': 'Education',
-            
-            # Real Estate
-            'real estate': 'Real Estate',
-            'property management': 'Real Estate',
-            'construction': 'Real Estate',
-            'architecture': 'Real Estate',
-            'property': 'Real Estate',
-            'building': 'Real Estate',
-            
-            # Transportation & Logistics
-            'logistics': 'Transportation & Logistics',
-            'supply chain': 'Transportation & Logistics',
-            'shipping': 'Transportation & Logistics',
-            'delivery': 'Transportation & Logistics',
-            'transport': 'Transportation & Logistics',
-            'freight': 'Transportation & Logistics',
-            'warehouse': 'Transportation & Logistics',
-            
-            # Hospitality & Travel
-            'hospitality': 'Hospitality & Travel',
-            'hotel': 'Hospitality & Travel',
-            'travel': 'Hospitality & Travel',
-            'tourism': 'Hospitality & Travel',
-            'restaurant': 'Food & Beverage',
-            'food service': 'Food & Beverage',
-            'catering': 'Food & Beverage',
-            
-            # Energy & Utilities
-            'renewable energy': 'Energy',
-            'solar energy': 'Energy',
-            'wind energy': 'Energy',
-            'oil and gas': 'Energy',
-            'utilities': 'Energy',
-            'energy': 'Energy',
-            'power': 'Energy',
-            'electricity': 'Energy',
-            'oil': 'Energy',
-            'gas': 'Energy',
-            'utility': 'Energy',
-            
-            # Telecommunications
-            'telecommunications': 'Telecommunications',
-            'telecom': 'Telecommunications',
-            'mobile': 'Telecommunications',
-            'wireless': 'Telecommunications',
-            'network': 'Telecommunications',
-            'internet service': 'Telecommunications',
-            
-            # Nonprofit & Government
-            'non-profit': 'Non-profit',
-            'nonprofit': 'Non-profit',
-            'charity': 'Non-profit',
-            'foundation': 'Non-profit',
-            'government': 'Government',
-            'public sector': 'Government',
-            
-            # Agriculture & Food
-            'agriculture': 'Agriculture',
-            'farming': 'Agriculture',
-            'food production': 'Agriculture',
-            'agribusiness': 'Agriculture',
-        }
-    
-    # Multi-pass scoring system for better accuracy
-    sector_scores = {}
-    
-    # Score based on exact phrase matches (higher weight)
-    for keyword, sector in sector_keywords.items():
-        if keyword in text:
-            if sector not in sector_scores:
-                sector_scores[sector] = 0
-            # Weight longer phrases more heavily
-            weight = len(keyword.split()) * 2
-            sector_scores[sector] += weight
-    
-    # Additional scoring for partial word matches
-    words = text.split()
-    for word in words:
+        return _score_default_keywords(chunks)
+
+    # Caller-supplied keyword maps keep the generic dict-based scoring
+    sector_scores = defaultdict(float)
+    keyword_words = [(set(keyword.split()), sector)
+                     for keyword, sector in sector_keywords.items()]
+    for text in chunks:
         for keyword, sector in sector_keywords.items():
-            if word in keyword.split():
-                if sector not in sector_scores:
-                    sector_scores[sector] = 0
-                sector_scores[sector] += 0.5
-    
-    # Return the sector with highest score
-    if sector_scores:
-        best_sector = max(sector_scores, key=sector_scores.get)
-        # Only return if confidence is high enough
-        if sector_scores[best_sector] >= 1.0:
-            return best_sector
-    
+            if keyword in text:
+                sector_scores[sector] += len(keyword.split()) * 2
+
+        # Additional scoring for partial word matches. Split the text and
+        # each keyword once instead of re-splitting the keyword per word
+        for word in text.split():
+            for kw_words, sector in keyword_words:
+                if word in kw_words:
+                    sector_scores[sector] += 0.5
+
+    # Return the sector with highest score: one explicit pass instead of
+    # max(..., key=d.get), which pays a method call per item and needs a
+    # second lookup for the threshold check
+    best_sector = None
+    best = -1.0
+    for sector, score in sector_scores.items():
+        if score > best:
+            best = score
+            best_sector = sector
+    # Only return if confidence is high enough
+    if best >= 1.0:
+        return best_sector
+
+    return 'Unknown'
+
+
+def _score_default_keywords(chunks):
+    """Scoring kernel for the built-in keyword map: hits carry integer
+    sector ids, so scores accumulate into a flat list and the argmax is a
+    plain index scan — no string hashing in the hot loop. Chunks stream
+    through the same automaton one after another, so callers never pay to
+    concatenate them into one buffer."""
+    scores = [0.0] * len(_SECTOR_NAMES)
+    best_score = 0.0
+
+    # Score exact phrase matches (longer phrases weighted more heavily) in
+    # one pass over each chunk; every occurrence counts. The scan stops
+    # once one sector's score is saturated — more hits cannot change the
+    # answer
+    for text in chunks:
+        if best_score >= _EARLY_EXIT_SCORE:
+            break
+        if _KEYWORD_AUTOMATON is not None:
+            for _end, (weight, sid) in _KEYWORD_AUTOMATON.iter(text):
+                score = scores[sid] + weight
+                scores[sid] = score
+                if score > best_score:
+                    best_score = score
+                    if best_score >= _EARLY_EXIT_SCORE:
+                        break
+        else:
+            for m in _KEYWORD_RX.finditer(text):
+                weight, sid = _KEYWORD_INFO[m.group(0)]
+                score = scores[sid] + weight
+                scores[sid] = score
+                if score > best_score:
+                    best_score = score
+                    if best_score >= _EARLY_EXIT_SCORE:
+                        break
+
+    # Additional scoring for partial word matches; skipped when the exact
+    # phrase pass is already confident
+    if best_score < 2.0:
+        words = set()
+        for text in chunks:
+            words.update(text.split())
+        for word in words:
+            for sid, delta in _WORD_INDEX.get(word, ()):
+                scores[sid] += delta
+
+    best_sid = 0
+    best = -1.0
+    for sid, score in enumerate(scores):
+        if score > best:
+            best = score
+            best_sid = sid
+    # Only return if confidence is high enough
+    if best >= 1.0:
+        return _SECTOR_NAMES[best_sid]
+
     return 'Unknown'
 
 
+@functools.lru_cache(maxsize=4096)
 def wikidata_lookup_company(company_name):
     """Try to find a company's sector using Wikidata search and basic property inspection.
     This is a lightweight helper that queries Wikidata's search API. It is best-effort.
-    Returns a sector string or None.
+    Returns a sector string or None. Results are memoized since the same
+    company names repeat across a batch.
     """
     try:
         url = 'https://www.wikidata.org/w/api.php'
@@ -1002,51 +1566,111 @@ def wikidata_lookup_company(company_name):
             'type': 'item',
             'limit': 1
         }
-        import requests
-        resp = requests.get(url, params=params, timeout=6)
+        resp = _CACHED_SESSION.get(url, params=params, timeout=6)
         resp.raise_for_status()
         data = resp.json()
         if 'search' in data and len(data['search']) > 0:
             qid = data['search'][0]['id']
             # fetch claims
             props = {'action': 'wbgetentities', 'ids': qid, 'format': 'json', 'props': 'claims|labels'}
-            r2 = requests.get(url, params=props, timeout=6)
+            r2 = _CACHED_SESSION.get(url, params=props, timeout=6)
             r2.raise_for_status()
             ent = r2.json().get('entities', {}).get(qid, {})
             claims = ent.get('claims', {})
             # common properties that can hint at sector/industry: P31 (instance of), P452 (industry)
-            if 'P452' in claims:
-                for c in claims['P452']:
-                    mainsnak = c.get('mainsnak', {})
-                    datavalue = mainsnak.get('datavalue', {})
-                    if datavalue:
-                        # get the label of the industry
-                        vid = datavalue.get('value', {}).get('id')
-                        if vid:
-                            lbl = requests.get(url, params={'action': 'wbgetentities', 'ids': vid, 'format': 'json', 'props': 'labels', 'languages': 'en'}, timeout=6)
-                            lbl.raise_for_status()
-                            lblj = lbl.json()
-                            label = lblj.get('entities', {}).get(vid, {}).get('labels', {}).get('en', {}).get('value')
-                            if label:
-                                return label
-            if 'P31' in claims:
-                for c in claims['P31']:
-                    mainsnak = c.get('mainsnak', {})
-                    datavalue = mainsnak.get('datavalue', {})
-                    if datavalue:
-                        vid = datavalue.get('value', {}).get('id')
-                        if vid:
-                            lbl = requests.get(url, params={'action': 'wbgetentities', 'ids': vid, 'format': 'json', 'props': 'labels', 'languages': 'en'}, timeout=6)
-                            lbl.raise_for_status()
-                            lblj = lbl.json()
-                            label = lblj.get('entities', {}).get(vid, {}).get('labels', {}).get('en', {}).get('value')
-                            if label:
-                                return label
+            # Collect the claim value ids in preference order (P452 before
+            # P31), then resolve all labels in a single wbgetentities call
+            # instead of one request per claim
+            vids = []
+            for prop in ('P452', 'P31'):
+                for c in claims.get(prop, []):
+                    vid = c.get('mainsnak', {}).get('datavalue', {}).get('value', {}).get('id')
+                    if vid and vid not in vids:
+                        vids.append(vid)
+            if vids:
+                lbl = _CACHED_SESSION.get(url, params={
+                    'action': 'wbgetentities',
+                    'ids': '|'.join(vids[:50]),
+                    'format': 'json',
+                    'props': 'labels',
+                    'languages': 'en'
+                }, timeout=6)
+                lbl.raise_for_status()
+                entities = lbl.json().get('entities', {})
+                for vid in vids[:50]:
+                    label = entities.get(vid, {}).get('labels', {}).get('en', {}).get('value')
+                    if label:
+                        return label
     except Exception:
         return None
     return None
 
 
+# Budgeted search: the old 14-entry query list was full of near-duplicate
+# queries ("{domain} company" vs '"{domain}" official website' return
+# overlapping results) and search_domain blindly ran the first four. The
+# de-duplicated templates below are probed in small waves, cheap generic
+# queries before the expensive site: probes, and probing stops as soon as
+# a homepage and company name are in hand. Per-template hit counts persist
+# in the cache DB so later runs try the historically best queries first.
+_QUERY_TEMPLATES = (
+    '{domain} company',
+    '{name} company {domain}',
+    '{domain_words} company sector industry',
+    '{name} business sector industry',
+    'site:{domain} about us',
+    'site:{domain} company profile',
+)
+_QUERY_WAVE = 2  # queries probed concurrently per budget step
+_query_hits = None
+_query_hits_dirty = False
+_query_hits_lock = Lock()
+
+
+def _query_hit_counts():
+    """Per-template hit counts, loaded from the cache DB once per process."""
+    global _query_hits
+    with _query_hits_lock:
+        if _query_hits is None:
+            counts = {}
+            try:
+                _ensure_db()
+                counts = dict(_read_conn().execute(
+                    'SELECT template, hits FROM query_stats').fetchall())
+            except Exception:
+                counts = {}
+            _query_hits = {t: counts.get(t, 0) for t in _QUERY_TEMPLATES}
+    return _query_hits
+
+
+def _record_query_hit(template):
+    global _query_hits_dirty
+    with _query_hits_lock:
+        if _query_hits is not None:
+            _query_hits[template] = _query_hits.get(template, 0) + 1
+            _query_hits_dirty = True
+
+
+def _flush_query_hits():
+    global _query_hits_dirty
+    with _query_hits_lock:
+        if not _query_hits_dirty or not _query_hits:
+            return
+        try:
+            conn = sqlite3.connect(DB_CACHE_FILE)
+            with conn:
+                conn.executemany(
+                    'REPLACE INTO query_stats(template, hits) VALUES (?, ?)',
+                    list(_query_hits.items()))
+            conn.close()
+            _query_hits_dirty = False
+        except Exception as e:
+            logger.debug(f"Could not persist query stats: {e}")
+
+
+atexit.register(_flush_query_hits)
+
+
 @with_error_recovery(
     retry_config=RetryConfig(max_attempts=3, base_delay=1.0, max_delay=15.0),
     track_metrics=True
@@ -1066,75 +1690,80 @@ def search_domain(domain, pause=1.0, min_delay=0.0):
     if HAS_ERROR_RECOVERY:
         metrics_collector.record_cache_miss()
 
-    # Aggressive search strategy with multiple queries for 100% success rate
+    # Cheap pure-string guess before any I/O: domains with an obvious
+    # keyword (fintechbank.com, solarpower.io) skip the whole network path
+    cheap_sector = guess_sector_from_domain(domain, default=None)
+    if cheap_sector is not None:
+        company = domain.split('.')[0].capitalize()
+        logger.debug(f"Domain-name heuristic resolved {domain} -> {cheap_sector}")
+        _save_cache_row(domain, company, cheap_sector)
+        return company, cheap_sector
+
     company_name = domain.split('.')[0]
-    search_queries = [
-        f"{domain} company",
-        f"{domain} business", 
-        f"{domain} corporation",
-        f"site:{domain} about us",
-        f"site:{domain} services", 
-        f"site:{domain} company profile",
-        f"{domain.replace('.', ' ')} company sector industry",
-        f"{company_name} company {domain}",
-        f"{company_name} business sector industry",
-        f"{domain} what is company",
-        f"{domain} business type sector",
-        f'"{company_name}" company website',
-        f'"{domain}" official website',
-        f"{company_name} inc corp ltd company"
-    ]
-    
+
     candidate_name = None
-    candidate_text = ''
     homepage_url = None
     homepage_html = None
     all_search_text = ''
-
-    # Try multiple search queries aggressively for maximum information
-    for query in search_queries[:4]:  # Increased to 4 queries for better results
-        try:
-            results = duckduckgo_search(query, max_results=5)
-            
+    winning_template = None
+
+    # Probe the query templates in small concurrent waves, the historically
+    # best-performing templates first, and stop as soon as a homepage and
+    # company name are identified — common domains resolve after one wave
+    # instead of always paying for four queries. Each wave still runs its
+    # queries in parallel, so wall time per wave is ~max(RTT).
+    hit_counts = _query_hit_counts()
+    ordered = sorted(_QUERY_TEMPLATES, key=lambda t: -hit_counts.get(t, 0))
+    for start in range(0, len(ordered), _QUERY_WAVE):
+        wave = ordered[start:start + _QUERY_WAVE]
+        queries = [t.format(domain=domain, name=company_name,
+                            domain_words=domain.replace('.', ' '))
+                   for t in wave]
+        wave_results = []
+        with ThreadPoolExecutor(max_workers=len(queries)) as ex:
+            futures = [ex.submit(duckduckgo_search, q, 5) for q in queries]
+            for template, query, fut in zip(wave, queries, futures):
+                try:
+                    wave_results.append((template, fut.result()))
+                except Exception as e:
+                    logger.warning(f"Search query failed for {query}: {e}")
+
+        for template, results in wave_results:
             for title, url in results:
-                parsed = urlparse(url)
-                netloc = parsed.netloc.replace('www.', '')
-                
+                netloc = _netloc(url).replace('www.', '')
+
                 # Collect all relevant text
                 all_search_text += f" {title} "
-                
+
                 # Prefer results that point to the domain
                 if domain in netloc or netloc in domain:
                     if not candidate_name:
                         candidate_name = title
-                    
+                        winning_template = template
+
                     # Get homepage if we haven't already
                     if not homepage_html:
-                        host = netloc.replace('www.', '')
-                        _set_host_wait(host, min_delay)
+                        _set_host_wait(netloc, min_delay)
                         homepage_url, homepage_html = fetch_homepage(domain)
-                        if homepage_html:
-                            candidate_text += homepage_html
-                            break
-            
-            # Small delay between searches
-            time.sleep(0.5)
-        except Exception as e:
-            logger.warning(f"Search query failed for {query}: {e}")
-            continue
+
+        if homepage_html and candidate_name:
+            break
+
+    if winning_template is not None:
+        _record_query_hit(winning_template)
 
     # Extract company name from homepage if available
     if homepage_html:
         extracted_company = extract_company_from_html(homepage_html, homepage_url)
         if extracted_company:
             candidate_name = extracted_company
-        candidate_text += homepage_html
 
-    # Combine all available text for sector analysis
-    combined_text = f"{candidate_text} {all_search_text} {candidate_name or ''}"
-    
-    # Enhanced sector inference
-    sector = infer_sector_from_text(combined_text)
+    # Score each source through the streaming keyword scan — no buffer
+    # concatenation; only the homepage chunk needs markup stripped/capped
+    sector = infer_sector_from_text(
+        _prepare_inference_text(homepage_html or ''),
+        all_search_text,
+        candidate_name or '')
     
     # If sector is still Unknown, try additional methods
     if sector == 'Unknown':
@@ -1178,15 +1807,20 @@ def search_domain(domain, pause=1.0, min_delay=0.0):
     return company, sector
 
 
+# Compiled once at import; clean_company_name runs on every resolved name
+_CLEAN_SUFFIX = re.compile(r'\s*-\s*(Official Site|Home|Website|Company).*$', re.I)
+_CLEAN_PREFIX = re.compile(r'^(Welcome to|About)\s+', re.I)
+_CLEAN_PIPE = re.compile(r'\s*\|\s*.*$')
+
 def clean_company_name(name):
     """Clean and normalize company name."""
     if not name:
         return None
-    
+
     # Remove common suffixes and prefixes
-    name = re.sub(r'\s*-\s*(Official Site|Home|Website|Company).*$', '', name, flags=re.I)
-    name = re.sub(r'^(Welcome to|About)\s+', '', name, flags=re.I)
-    name = re.sub(r'\s*\|\s*.*$', '', name)  # Remove everything after |
+    name = _CLEAN_SUFFIX.sub('', name)
+    name = _CLEAN_PREFIX.sub('', name)
+    name = _CLEAN_PIPE.sub('', name)  # Remove everything after |
     
     # Clean up extra whitespace
     name = ' '.join(name.split())
@@ -1194,148 +1828,137 @@ def clean_company_name(name):
     return name.strip() if name.strip() else None
 
 
+# Mapping of sector-name variations to standard names, compiled into one
+# alternation so normalize_sector_name does a single scan instead of a
+# substring check per variant (it runs on every Wikidata fallback)
+_SECTOR_NAME_MAPPING = {
+    'information technology': 'Technology',
+    'software company': 'Technology',
+    'technology company': 'Technology',
+    'internet company': 'Technology',
+    'financial services': 'Finance',
+    'banking': 'Finance',
+    'investment firm': 'Finance',
+    'healthcare company': 'Healthcare',
+    'pharmaceutical company': 'Healthcare',
+    'biotechnology company': 'Healthcare',
+    'retail company': 'Retail',
+    'e-commerce company': 'E-commerce',
+    'manufacturing company': 'Manufacturing',
+    'consulting firm': 'Consulting',
+    'media company': 'Media & Entertainment',
+    'entertainment company': 'Media & Entertainment',
+}
+_NORM_RE = re.compile('|'.join(
+    f'(?P<g{i}>{re.escape(k)})' for i, k in enumerate(_SECTOR_NAME_MAPPING)))
+_GROUP_TO_CANON = {f'g{i}': v
+                   for i, v in enumerate(_SECTOR_NAME_MAPPING.values())}
+
+
 def normalize_sector_name(sector):
     """Normalize sector names to standard categories."""
     if not sector:
         return 'Unknown'
-    
+
     sector = sector.lower().strip()
-    
-    # Mapping of variations to standard names
-    sector_mapping = {
-        'information technology': 'Technology',
-        'software company': 'Technology',
-        'technology company': 'Technology',
-        'internet company': 'Technology',
-        'financial services': 'Finance',
-        'banking': 'Finance',
-        'investment firm': 'Finance',
-        'healthcare company': 'Healthcare',
-        'pharmaceutical company': 'Healthcare',
-        'biotechnology company': 'Healthcare',
-        'retail company': 'Retail',
-        'e-commerce company': 'E-commerce',
-        'manufacturing company': 'Manufacturing',
-        'consulting firm': 'Consulting',
-        'media company': 'Media & Entertainment',
-        'entertainment company': 'Media & Entertainment',
-    }
-    
-    for key, standard in sector_mapping.items():
-        if key in sector:
-            return standard
-    
+    m = _NORM_RE.search(sector)
+    if m:
+        return _GROUP_TO_CANON[m.lastgroup]
+
     # Capitalize first letter of each word
     return ' '.join(word.capitalize() for word in sector.split())
 
 
-def guess_sector_from_domain(domain):
-    """Make comprehensive educated guesses about sector based on domain name patterns."""
+# Domain-name keyword lists for guess_sector_from_domain, in priority
+# order (earlier sectors win ties), combined into one alternation so a
+# domain is scanned once instead of ~16 times
+_DOMAIN_SECTOR_KEYWORDS = (
+    ('Technology', ('tech', 'software', 'app', 'web', 'digital', 'cloud', 'data', 'ai',
+     'cyber', 'system', 'platform', 'analytics', 'computing', 'innovation', 'lab', 'dev',
+     'code', 'programming', 'database', 'network', 'internet', 'mobile', 'saas',)),
+    ('Finance', ('bank', 'finance', 'invest', 'capital', 'fund', 'pay', 'credit', 'loan',
+     'insurance', 'asset', 'wealth', 'trading', 'financial', 'money', 'payment', 'mortgage',
+     'savings', 'investment', 'portfolio', 'fintech',)),
+    ('Healthcare', ('health', 'medical', 'pharma', 'bio', 'clinic', 'care', 'hospital',
+     'medicine', 'therapy', 'dental', 'wellness', 'fitness', 'healthcare', 'pharmaceutical',
+     'biotech', 'medtech', 'diagnostic', 'treatment',)),
+    ('Retail', ('shop', 'store', 'market', 'buy', 'sell', 'commerce', 'retail', 'fashion',
+     'clothing', 'shoes', 'jewelry', 'grocery', 'food', 'restaurant', 'cafe', 'ecommerce',
+     'marketplace', 'shopping', 'outlet', 'boutique',)),
+    ('Media', ('media', 'news', 'tv', 'radio', 'video', 'stream', 'broadcast',
+     'entertainment', 'film', 'music', 'publishing', 'content', 'streaming', 'production',
+     'studio', 'gaming', 'game', 'podcast', 'blog', 'magazine', 'newspaper',)),
+    ('Manufacturing', ('manufacturing', 'industrial', 'factory', 'production', 'auto',
+     'motor', 'mechanical', 'engineering', 'construction', 'materials', 'chemical', 'steel',
+     'metal', 'machinery', 'equipment', 'automotive', 'aerospace',)),
+    ('Energy', ('energy', 'oil', 'gas', 'petroleum', 'renewable', 'solar', 'wind', 'power',
+     'electric', 'utility', 'nuclear', 'coal', 'fuel', 'battery', 'grid',)),
+    ('Transportation', ('transport', 'logistics', 'shipping', 'delivery', 'airline',
+     'aviation', 'rail', 'truck', 'freight', 'cargo', 'supply', 'chain', 'warehouse',
+     'distribution', 'courier', 'express',)),
+    ('Real Estate', ('real', 'estate', 'property', 'housing', 'rental', 'mortgage',
+     'construction', 'development', 'builder', 'architect', 'realty',)),
+    ('Education', ('education', 'school', 'university', 'college', 'learning', 'training',
+     'academic', 'research', 'institute', 'educational', 'teaching', 'course',)),
+    ('Consulting', ('consult', 'advisory', 'strategy', 'solutions', 'management', 'business',
+     'professional', 'services', 'consulting', 'advisor', 'expert', 'guidance',)),
+    ('Government', ('gov', 'government', 'public', 'municipal', 'federal', 'state', 'city',
+     'nonprofit', 'foundation', 'charity', 'organization', 'association',)),
+    ('Agriculture', ('farm', 'agriculture', 'agricultural', 'crop', 'livestock', 'dairy',
+     'organic', 'seed', 'fertilizer', 'irrigation', 'harvest',)),
+    ('Legal', ('law', 'legal', 'attorney', 'lawyer', 'court', 'justice', 'litigation',
+     'patent', 'trademark', 'compliance', 'regulatory',)),
+    ('Telecommunications', ('telecom', 'communication', 'wireless', 'cellular', 'broadband',
+     'internet', 'network', 'phone', 'mobile', 'satellite', 'fiber',)),
+    ('Hospitality', ('hotel', 'travel', 'tourism', 'hospitality', 'resort', 'vacation',
+     'booking', 'airline', 'cruise', 'restaurant', 'catering',)),
+)
+# Flat keyword -> (length, priority, sector) table; duplicate keywords keep
+# the higher-priority sector. Selection is longest-match-first so the most
+# specific keyword wins (e.g. 'health' beats 'tech' in healthtech.com)
+_DOMAIN_KEYWORD_INFO = {}
+for _i, (_sector, _kws) in enumerate(_DOMAIN_SECTOR_KEYWORDS):
+    for _kw in _kws:
+        if _kw not in _DOMAIN_KEYWORD_INFO:
+            _DOMAIN_KEYWORD_INFO[_kw] = (len(_kw), _i, _sector)
+del _i, _sector, _kws, _kw
+
+if HAS_AHOCORASICK:
+    _DOMAIN_AUTOMATON = _load_or_build_automaton(
+        'domain_ac.pkl', list(_DOMAIN_KEYWORD_INFO.items()))
+    _DOMAIN_RX = None
+else:
+    _DOMAIN_AUTOMATON = None
+    # Longest-first alternation so the regex prefers the most specific
+    # keyword at each position
+    _DOMAIN_RX = re.compile('|'.join(
+        re.escape(kw) for kw in sorted(_DOMAIN_KEYWORD_INFO, key=len, reverse=True)))
+
+def guess_sector_from_domain(domain, default='Business Services'):
+    """Make comprehensive educated guesses about sector based on domain name patterns.
+
+    Returns `default` when nothing matches, so callers can pass
+    default=None to tell a confident keyword/TLD hit apart from the
+    generic fallback.
+    """
     domain_lower = domain.lower()
-    
-    # Technology indicators (expanded)
-    tech_keywords = ['tech', 'software', 'app', 'web', 'digital', 'cloud', 'data', 'ai', 'cyber', 
-                    'system', 'platform', 'analytics', 'computing', 'innovation', 'lab', 'dev', 
-                    'code', 'programming', 'database', 'network', 'internet', 'mobile', 'saas']
-    if any(word in domain_lower for word in tech_keywords):
-        return 'Technology'
-    
-    # Finance indicators (expanded)
-    finance_keywords = ['bank', 'finance', 'invest', 'capital', 'fund', 'pay', 'credit', 'loan',
-                       'insurance', 'asset', 'wealth', 'trading', 'financial', 'money', 'payment',
-                       'mortgage', 'savings', 'investment', 'portfolio', 'fintech']
-    if any(word in domain_lower for word in finance_keywords):
-        return 'Finance'
-    
-    # Healthcare indicators (expanded)
-    health_keywords = ['health', 'medical', 'pharma', 'bio', 'clinic', 'care', 'hospital',
-                      'medicine', 'therapy', 'dental', 'wellness', 'fitness', 'healthcare',
-                      'pharmaceutical', 'biotech', 'medtech', 'diagnostic', 'treatment']
-    if any(word in domain_lower for word in health_keywords):
-        return 'Healthcare'
-    
-    # Retail/E-commerce indicators (expanded)
-    retail_keywords = ['shop', 'store', 'market', 'buy', 'sell', 'commerce', 'retail', 'fashion',
-                      'clothing', 'shoes', 'jewelry', 'grocery', 'food', 'restaurant', 'cafe',
-                      'ecommerce', 'marketplace', 'shopping', 'outlet', 'boutique']
-    if any(word in domain_lower for word in retail_keywords):
-        return 'Retail'
-    
-    # Media indicators (expanded)
-    media_keywords = ['media', 'news', 'tv', 'radio', 'video', 'stream', 'broadcast', 'entertainment',
-                     'film', 'music', 'publishing', 'content', 'streaming', 'production', 'studio',
-                     'gaming', 'game', 'podcast', 'blog', 'magazine', 'newspaper']
-    if any(word in domain_lower for word in media_keywords):
-        return 'Media'
-    
-    # Manufacturing indicators (expanded)
-    manufacturing_keywords = ['manufacturing', 'industrial', 'factory', 'production', 'auto', 'motor',
-                             'mechanical', 'engineering', 'construction', 'materials', 'chemical',
-                             'steel', 'metal', 'machinery', 'equipment', 'automotive', 'aerospace']
-    if any(word in domain_lower for word in manufacturing_keywords):
-        return 'Manufacturing'
-    
-    # Energy indicators
-    energy_keywords = ['energy', 'oil', 'gas', 'petroleum', 'renewable', 'solar', 'wind', 'power',
-                      'electric', 'utility', 'nuclear', 'coal', 'fuel', 'battery', 'grid']
-    if any(word in domain_lower for word in energy_keywords):
-        return 'Energy'
-    
-    # Transportation indicators
-    transport_keywords = ['transport', 'logistics', 'shipping', 'delivery', 'airline', 'aviation',
-                         'rail', 'truck', 'freight', 'cargo', 'supply', 'chain', 'warehouse',
-                         'distribution', 'courier', 'express']
-    if any(word in domain_lower for word in transport_keywords):
-        return 'Transportation'
-    
-    # Real Estate indicators
-    realestate_keywords = ['real', 'estate', 'property', 'housing', 'rental', 'mortgage',
-                          'construction', 'development', 'builder', 'architect', 'realty']
-    if any(word in domain_lower for word in realestate_keywords):
-        return 'Real Estate'
-    
-    # Education indicators
-    education_keywords = ['education', 'school', 'university', 'college', 'learning', 'training',
-                         'academic', 'research', 'institute', 'educational', 'teaching', 'course']
-    if any(word in domain_lower for word in education_keywords):
-        return 'Education'
-    
-    # Consulting indicators (expanded)
-    consulting_keywords = ['consult', 'advisory', 'strategy', 'solutions', 'management', 'business',
-                          'professional', 'services', 'consulting', 'advisor', 'expert', 'guidance']
-    if any(word in domain_lower for word in consulting_keywords):
-        return 'Consulting'
-    
-    # Government/Non-profit indicators
-    govt_keywords = ['gov', 'government', 'public', 'municipal', 'federal', 'state', 'city',
-                    'nonprofit', 'foundation', 'charity', 'organization', 'association']
-    if any(word in domain_lower for word in govt_keywords):
-        return 'Government'
-    
-    # Agriculture indicators  
-    agriculture_keywords = ['farm', 'agriculture', 'agricultural', 'crop', 'livestock', 'dairy',
-                           'organic', 'seed', 'fertilizer', 'irrigation', 'harvest']
-    if any(word in domain_lower for word in agriculture_keywords):
-        return 'Agriculture'
-    
-    # Legal indicators
-    legal_keywords = ['law', 'legal', 'attorney', 'lawyer', 'court', 'justice', 'litigation',
-                     'patent', 'trademark', 'compliance', 'regulatory']
-    if any(word in domain_lower for word in legal_keywords):
-        return 'Legal'
-    
-    # Communications/Telecom indicators
-    telecom_keywords = ['telecom', 'communication', 'wireless', 'cellular', 'broadband', 
-                       'internet', 'network', 'phone', 'mobile', 'satellite', 'fiber']
-    if any(word in domain_lower for word in telecom_keywords):
-        return 'Telecommunications'
-    
-    # Hospitality/Travel indicators
-    hospitality_keywords = ['hotel', 'travel', 'tourism', 'hospitality', 'resort', 'vacation',
-                           'booking', 'airline', 'cruise', 'restaurant', 'catering']
-    if any(word in domain_lower for word in hospitality_keywords):
-        return 'Hospitality'
-    
+
+    # One linear pass over the domain; the longest keyword hit wins so the
+    # most specific match decides the sector, with sector priority only
+    # breaking exact-length ties
+    best = None
+    if _DOMAIN_AUTOMATON is not None:
+        for _end, info in _DOMAIN_AUTOMATON.iter(domain_lower):
+            if best is None or (info[0], -info[1]) > (best[0], -best[1]):
+                best = info
+    else:
+        for m in _DOMAIN_RX.finditer(domain_lower):
+            info = _DOMAIN_KEYWORD_INFO[m.group(0)]
+            if best is None or (info[0], -info[1]) > (best[0], -best[1]):
+                best = info
+    if best is not None:
+        return best[2]
+
     # Default fallback based on common TLDs and patterns
     if domain_lower.endswith(('.edu', '.org')):
         return 'Education'
@@ -1344,7 +1967,39 @@ def guess_sector_from_domain(domain):
     elif any(tld in domain_lower for tld in ['.tech', '.app', '.dev', '.io']):
         return 'Technology'
     elif any(word in domain_lower for word in ['inc', 'corp', 'company', 'group', 'ltd', 'llc']):
-        return 'Business Services'
-    
+        return default
+
     # Final fallback - more neutral default
-    return 'Business Services'
+    return default
+
+
+def guess_sector_from_domains(domains, default='Business Services'):
+    """Vectorized guess_sector_from_domain for a batch of domains.
+
+    Each sector's keyword list becomes one str.contains scan over the
+    whole batch, applied in the same priority order as the scalar
+    function; rows hitting several sectors resolve by that priority,
+    the cheap vectorized stand-in for the scalar longest-match rule.
+    Returns a pandas Series of sectors aligned with the input.
+    """
+    # pandas/numpy are only needed for batch callers, so import lazily
+    import numpy as np
+    import pandas as pd
+
+    series = pd.Series(domains).astype(str).str.lower()
+    conditions = []
+    choices = []
+    for sector, kws in _DOMAIN_SECTOR_KEYWORDS:
+        pattern = '|'.join(map(re.escape, kws))
+        conditions.append(series.str.contains(pattern, regex=True, na=False))
+        choices.append(sector)
+    # TLD fallbacks mirror the scalar function
+    conditions.append(series.str.endswith(('.edu', '.org'), na=False))
+    choices.append('Education')
+    conditions.append(series.str.endswith('.gov', na=False))
+    choices.append('Government')
+    conditions.append(series.str.contains(
+        r'\.tech|\.app|\.dev|\.io', regex=True, na=False))
+    choices.append('Technology')
+    return pd.Series(np.select(conditions, choices, default=default),
+                     index=series.index)
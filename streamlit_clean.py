@@ -1,23 +1,30 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import io
 import os
 import sys
+import time
+import pickle
+import sqlite3
+import hashlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import tempfile
 
 # Add the current directory to Python path to import our modules
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
-# Import our core processing modules
-try:
+
+@functools.lru_cache(maxsize=1)
+def _get_processors():
+    """Import the processing pipelines on first use. main/restored_ui
+    transitively pull in Flask, RapidFuzz, and the whole scraping stack;
+    deferring them keeps cold start to the first page paint."""
     from main import process_emails
-    from searcher import search_domain
     from restored_ui import enhanced_process_emails, fast_process_emails
-except ImportError as e:
-    st.error(f"Error importing modules: {e}")
-    st.stop()
+    return process_emails, enhanced_process_emails, fast_process_emails
 
 # Page configuration
 st.set_page_config(
@@ -27,8 +34,21 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better UI
-st.markdown("""
+# Callable data for st.download_button (click-time serialization) needs
+# Streamlit >=1.45; requirements.txt only floors at 1.25, so older
+# installs fall back to eager bytes instead of crashing at render
+try:
+    _DEFERRED_DOWNLOADS = tuple(
+        int(p) for p in st.__version__.split('.')[:2]) >= (1, 45)
+except ValueError:
+    _DEFERRED_DOWNLOADS = False
+
+# Static chrome is built once at import time as module-level constants;
+# each rerun just hands Streamlit the same interned string instead of
+# re-constructing it. (Wrapping the st.markdown calls themselves in
+# st.cache_resource would skip the render side effect on cache hits and
+# drop the elements from the page, so the strings are hoisted instead.)
+_CSS_HTML = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -57,7 +77,21 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# All four metrics are constants, so they render as one pre-built HTML
+# grid - a single element and one WebSocket message per rerun instead of
+# two st.columns plus four st.metric elements
+_SIDEBAR_METRICS_HTML = """
+<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 0.5rem;">
+    <div class="metric-container">🎯<br><b>100%</b><br>Success Rate</div>
+    <div class="metric-container">⚡<br><b>5x</b><br>Speed Boost</div>
+    <div class="metric-container">📄<br><b>7</b><br>File Formats</div>
+    <div class="metric-container">🏢<br><b>200+</b><br>Companies DB</div>
+</div>
+"""
+
+st.markdown(_CSS_HTML, unsafe_allow_html=True)
 
 def main():
     # Header
@@ -77,14 +111,9 @@ def main():
         """)
         
         st.markdown("## 📊 Performance Metrics")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Success Rate", "100%", "🎯")
-            st.metric("File Formats", "7", "📄")
-        with col2:
-            st.metric("Speed Boost", "5x", "⚡")
-            st.metric("Companies DB", "200+", "🏢")
-            
+        st.markdown(_SIDEBAR_METRICS_HTML, unsafe_allow_html=True)
+
+
         st.markdown("## 🛠️ Technical Stack")
         st.markdown("""
         - **Backend**: Python, pandas
@@ -126,24 +155,157 @@ def main():
     if uploaded_file is not None:
         st.markdown("---")
         
-        # File info
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.info(f"📄 **File**: {uploaded_file.name}")
-        with col2:
-            st.info(f"📏 **Size**: {uploaded_file.size:,} bytes")
-        with col3:
-            file_type = uploaded_file.name.split('.')[-1].upper()
-            st.info(f"🔧 **Type**: {file_type}")
-            
+        # File info: one flexbox element instead of a three-column layout
+        # with three st.info boxes (four DOM nodes and WebSocket messages
+        # per rerun down to one)
+        file_type = os.path.splitext(uploaded_file.name)[1].lstrip('.').upper()
+        st.markdown(
+            f'<div style="display: flex; gap: 1rem;">'
+            f'<div class="feature-box" style="flex: 1;">📄 <b>File</b>: {uploaded_file.name}</div>'
+            f'<div class="feature-box" style="flex: 1;">📏 <b>Size</b>: {uploaded_file.size:,} bytes</div>'
+            f'<div class="feature-box" style="flex: 1;">🔧 <b>Type</b>: {file_type}</div>'
+            f'</div>',
+            unsafe_allow_html=True)
+
+
         # Process button
         if st.button("🚀 Process File", type="primary", use_container_width=True):
             process_file(uploaded_file, processing_mode, show_progress)
+        elif st.session_state.get('results') is not None:
+            # Streamlit re-executes the script on every widget tweak;
+            # re-render the last results from session state instead of
+            # losing them (or re-running the pipeline)
+            display_results(st.session_state.results)
+
+# Processed-result cache keyed by (file content hash, processing mode):
+# re-uploading the same file costs one SQLite lookup instead of re-running
+# the whole scraping pipeline. blake2b is the fastest stdlib hash.
+RESULT_CACHE_DB = os.path.join(current_dir, 'Dataset', 'result_cache.db')
+
+
+def _result_cache_conn():
+    os.makedirs(os.path.dirname(RESULT_CACHE_DB), exist_ok=True)
+    conn = sqlite3.connect(RESULT_CACHE_DB)
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS results (
+            key TEXT,
+            mode TEXT,
+            created INTEGER,
+            frame BLOB,
+            PRIMARY KEY (key, mode)
+        )
+    ''')
+    return conn
+
+
+def _cached_result(digest, mode):
+    """Return the cached DataFrame for (digest, mode), or None on miss."""
+    try:
+        conn = _result_cache_conn()
+        row = conn.execute('SELECT frame FROM results WHERE key = ? AND mode = ?',
+                           (digest, mode)).fetchone()
+        conn.close()
+        if row:
+            return pickle.loads(row[0])
+    except Exception:
+        pass
+    return None
+
+
+def _store_result(digest, mode, df):
+    try:
+        conn = _result_cache_conn()
+        with conn:
+            conn.execute(
+                'REPLACE INTO results(key, mode, created, frame) VALUES (?, ?, ?, ?)',
+                (digest, mode, int(time.time()),
+                 pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)))
+        conn.close()
+    except Exception:
+        pass
+
+
+def _load_emails_df(name, data):
+    """Parse uploaded bytes into a DataFrame with an 'email' column.
+
+    Every parser here accepts a file-like object, so the upload never
+    takes a round-trip through a temp file on disk.
+    """
+    from restored_ui import extract_emails_with_context, create_dataframe_from_emails
+
+    ext = os.path.splitext(name)[1].lower()
+    buf = io.BytesIO(data)
+    if ext == '.csv':
+        df = pd.read_csv(buf)
+    elif ext in ('.xlsx', '.xls'):
+        df = pd.read_excel(buf)
+    elif ext == '.json':
+        df = pd.read_json(buf)
+    elif ext in ('.docx', '.doc'):
+        import docx
+        doc = docx.Document(buf)
+        emails, names, other = extract_emails_with_context(
+            (p.text for p in doc.paragraphs), fast_mode=True)
+        return create_dataframe_from_emails(emails, names, other)
+    elif ext == '.pdf':
+        try:
+            import pypdfium2 as pdfium
+            pdf = pdfium.PdfDocument(buf)
+            try:
+                # Page extraction stays sequential on purpose: PDFium is
+                # not thread-safe and pypdfium2 adds no locking, so
+                # fanning pages out over a thread pool can corrupt state.
+                # The C extractor is fast enough that the scan (not the
+                # extraction) dominates anyway.
+                emails, names, other = extract_emails_with_context(
+                    (pdf[i].get_textpage().get_text_range()
+                     for i in range(len(pdf))), fast_mode=True)
+            finally:
+                pdf.close()
+        except ImportError:
+            import pdfplumber
+            with pdfplumber.open(buf) as pdf:
+                emails, names, other = extract_emails_with_context(
+                    (page.extract_text() or '' for page in pdf.pages),
+                    fast_mode=True)
+        return create_dataframe_from_emails(emails, names, other)
+    else:
+        # txt/xml and anything else: scan the raw text for addresses
+        emails, names, other = extract_emails_with_context(
+            data.decode('utf-8', errors='ignore'), fast_mode=True)
+        return create_dataframe_from_emails(emails, names, other)
+
+    # Normalize the email column name for the processing pipelines
+    lower_cols = {str(c).lower().strip(): c for c in df.columns}
+    for candidate in ('email', 'emails', 'e-mail', 'e_mail', 'email_address', 'mail'):
+        if candidate in lower_cols:
+            return df.rename(columns={lower_cols[candidate]: 'email'})
+    raise ValueError('No email column found in the uploaded file')
+
 
 def process_file(uploaded_file, processing_mode, show_progress):
     """Process the uploaded file and display results."""
-    
+
     try:
+        # One grab of the upload buffer, shared by the hash and the parser
+        # below; getvalue() is idempotent, unlike read(), which would leave
+        # an exhausted stream for Streamlit reruns
+        raw = uploaded_file.getvalue()
+
+        # Repeat runs of identical inputs (the common demo/iteration
+        # workflow) come from session state within a session, then the
+        # persistent result cache across sessions
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        if st.session_state.get('results_key') == (digest, processing_mode):
+            display_results(st.session_state.results)
+            return
+        cached_df = _cached_result(digest, processing_mode)
+        if cached_df is not None and not cached_df.empty:
+            st.success("✅ Loaded cached results for this file")
+            st.session_state.results = cached_df
+            st.session_state.results_key = (digest, processing_mode)
+            display_results(cached_df)
+            return
         # Create progress indicators
         progress_bar = st.progress(0)
         status_text = st.empty()
@@ -171,21 +333,34 @@ def process_file(uploaded_file, processing_mode, show_progress):
         if show_progress:
             file_progress.text("✅ File loaded")
 
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-            tmp_file.write(uploaded_file.getbuffer())
-            tmp_file_path = tmp_file.name
-            
+        process_emails, enhanced_process_emails, fast_process_emails = _get_processors()
+        emails_df = _load_emails_df(uploaded_file.name, raw)
+
         progress_bar.progress(30)
         status_text.text("Processing emails...")
-        
+
         # Choose processing function based on mode
         if processing_mode == "Enhanced (Web Search)":
-            result_df = enhanced_process_emails(tmp_file_path)
+            # Web scraping is almost pure I/O wait, so shard the frame
+            # across a thread pool and let the shards overlap their HTTP
+            # round-trips; small uploads stay on the single-call path
+            shard_count = min(8, max(1, len(emails_df) // 25))
+            if shard_count > 1:
+                # Explicit iloc slicing: np.array_split on a DataFrame
+                # goes through the deprecated DataFrame.swapaxes and
+                # degrades to object arrays once pandas removes it
+                bounds = np.linspace(0, len(emails_df), shard_count + 1, dtype=int)
+                shards = [emails_df.iloc[a:b] for a, b in zip(bounds, bounds[1:])]
+                with ThreadPoolExecutor(max_workers=shard_count) as ex:
+                    parts = list(ex.map(enhanced_process_emails, shards))
+                result_df = pd.concat(parts, ignore_index=True)
+            else:
+                result_df = enhanced_process_emails(emails_df)
         elif processing_mode == "Fast (Local Only)":
-            result_df = fast_process_emails(tmp_file_path)
+            # CPU-bound local matching gains nothing from threads (GIL)
+            result_df = fast_process_emails(emails_df)
         else:  # Full (Maximum Accuracy)
-            result_df = process_emails(tmp_file_path)
+            result_df = process_emails(emails_df)
 
         if show_progress:
             search_progress.text("✅ Search complete")
@@ -195,47 +370,79 @@ def process_file(uploaded_file, processing_mode, show_progress):
         
         if show_progress:
             data_progress.text("✅ Processing complete")
-            
-        # Clean up temporary file
-        os.unlink(tmp_file_path)
-        
+
         progress_bar.progress(100)
         status_text.text("✅ Processing completed successfully!")
         
         # Display results
         if result_df is not None and not result_df.empty:
+            _store_result(digest, processing_mode, result_df)
+            st.session_state.results = result_df
+            st.session_state.results_key = (digest, processing_mode)
             display_results(result_df)
         else:
             st.error("No results generated. Please check your file format and content.")
             
     except Exception as e:
         st.error(f"Error processing file: {str(e)}")
-        # Clean up temporary file if it exists
-        try:
-            if 'tmp_file_path' in locals():
-                os.unlink(tmp_file_path)
-        except:
-            pass
 
 def display_results(result_df):
     """Display the processed results with download options."""
     
     st.markdown("---")
     st.markdown("## 📊 Processing Results")
-    
+
+    # Categorical company/sector columns: the Unknown comparison below
+    # becomes an int8 code comparison instead of one Python string
+    # compare per row, and the two columns shrink to codes + one copy of
+    # each distinct value. Remaining object columns become pandas string
+    # dtype so st.dataframe's Arrow serialization (re-run on every widget
+    # interaction) skips per-cell type inference. In-place, so the frame
+    # held in session state only pays for the conversion once.
+    for col in result_df.columns:
+        if result_df[col].dtype == object:
+            if col in ('company', 'sector'):
+                result_df[col] = result_df[col].astype('category')
+            else:
+                result_df[col] = result_df[col].astype('string')
+
+    # Derived stats are computed once per result set and read back from
+    # session state on later reruns. Keyed by results_key (already
+    # maintained alongside the frame) rather than re-hashing the frame,
+    # which would itself cost a full pass per rerun.
+    stats = st.session_state.get('results_stats')
+    if stats is None or stats['key'] != st.session_state.get('results_key'):
+        # Compare integer category codes instead of building a
+        # boolean-indexed copy of the frame just for len()
+        categories = result_df['company'].cat.categories
+        unknown_code = categories.get_loc('Unknown') if 'Unknown' in categories else -1
+        companies_found = int((result_df['company'].cat.codes.to_numpy() != unknown_code).sum())
+        # One bincount over the int8 category codes instead of
+        # value_counts' hash-based counting of Python string objects
+        codes = result_df['sector'].cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0],
+                             minlength=len(result_df['sector'].cat.categories))
+        stats = {
+            'key': st.session_state.get('results_key'),
+            'companies_found': companies_found,
+            'sector_count': int(result_df['sector'].nunique()),
+            'sector_counts': pd.Series(
+                counts, index=result_df['sector'].cat.categories
+            ).sort_values(ascending=False),
+        }
+        st.session_state.results_stats = stats
+
     # Results summary
     col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.metric("📧 Total Emails", len(result_df))
     with col2:
-        companies_found = len(result_df[result_df['company'] != 'Unknown'])
-        st.metric("🏢 Companies Found", companies_found)
+        st.metric("🏢 Companies Found", stats['companies_found'])
     with col3:
-        success_rate = (companies_found / len(result_df)) * 100 if len(result_df) > 0 else 0
+        success_rate = (stats['companies_found'] / len(result_df)) * 100 if len(result_df) > 0 else 0
         st.metric("🎯 Success Rate", f"{success_rate:.1f}%")
     with col4:
-        unique_sectors = len(result_df['sector'].unique())
-        st.metric("🏭 Sectors", unique_sectors)
+        st.metric("🏭 Sectors", stats['sector_count'])
 
     # Display data table
     st.markdown("### 📋 Detailed Results")
@@ -243,63 +450,115 @@ def display_results(result_df):
 
     # Download options
     st.markdown("### 📥 Download Results")
+
+    # One timestamp shared by both download filenames, pinned in session
+    # state per result set: formatting once instead of twice, and the
+    # Excel and CSV names can no longer disagree by a second (or drift on
+    # the rerun a download click itself triggers)
+    if st.session_state.get('results_ts_key') != st.session_state.get('results_key'):
+        st.session_state.results_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+        st.session_state.results_ts_key = st.session_state.get('results_key')
+    ts = st.session_state.results_ts
+
     col1, col2 = st.columns(2)
 
+    # Zero-arg callables defer serialization to click time: renders of
+    # the results page no longer build (or hold) either payload, and the
+    # cache_data wrapper still makes repeat clicks free
+    if _DEFERRED_DOWNLOADS:
+        excel_data = lambda: create_excel_download(result_df)
+        csv_data = lambda: create_csv_download(result_df)
+    else:
+        excel_data = create_excel_download(result_df)
+        csv_data = create_csv_download(result_df)
+
     with col1:
         # Excel download
-        excel_buffer = create_excel_download(result_df)
         st.download_button(
             label="📊 Download Excel File",
-            data=excel_buffer,
-            file_name=f"email_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+            data=excel_data,
+            file_name=f"email_results_{ts}.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             type="primary"
         )
 
     with col2:
         # CSV download
-        csv_buffer = create_csv_download(result_df)
         st.download_button(
-            label="📄 Download CSV File", 
-            data=csv_buffer,
-            file_name=f"email_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            label="📄 Download CSV File",
+            data=csv_data,
+            file_name=f"email_results_{ts}.csv",
             mime="text/csv"
         )
 
     # Sector distribution
     if len(result_df) > 0:
         st.markdown("### 📈 Sector Distribution")
-        sector_counts = result_df['sector'].value_counts()
-        st.bar_chart(sector_counts)
+        st.bar_chart(stats['sector_counts'])
 
+# Both serializers are pure functions of the DataFrame, but Streamlit
+# re-executes the script on every widget interaction - the cache returns
+# the previously built bytes instead of re-serializing, with max_entries
+# bounding how many result sets stay pinned in RAM
+@st.cache_data(max_entries=8, show_spinner=False)
 def create_excel_download(df):
     """Create Excel file for download."""
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+
+    # Column widths computed from the DataFrame (one vectorized str.len
+    # pass per column) instead of walking every worksheet cell through
+    # openpyxl's slow cell objects
+    widths = []
+    for col in df.columns:
+        longest = df[col].astype(str).str.len().max()
+        longest = 0 if pd.isna(longest) else int(longest)
+        # cap so one long cell can't blow a column out to absurd width
+        widths.append(min(max(longest, len(str(col))) + 2, 60))
+
+    # xlsxwriter's C-accelerated writer when available; openpyxl otherwise.
+    # constant_memory streams rows out as they are written instead of
+    # holding one object per cell, so peak memory stays O(cols) even for
+    # very large result sets (widths above were precomputed, so column
+    # sizing needs no second pass over the sheet)
+    try:
+        import xlsxwriter  # noqa: F401
+        engine = 'xlsxwriter'
+        engine_kwargs = {'options': {'constant_memory': True}}
+    except ImportError:
+        engine = 'openpyxl'
+        engine_kwargs = {}
+
+    with pd.ExcelWriter(output, engine=engine, engine_kwargs=engine_kwargs) as writer:
         df.to_excel(writer, sheet_name='Email Results', index=False)
-        
-        # Add some formatting
-        workbook = writer.book
         worksheet = writer.sheets['Email Results']
-        
-        # Auto-adjust column widths
-        for column in worksheet.columns:
-            max_length = 0
-            column = [cell for cell in column]
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = (max_length + 2)
-            worksheet.column_dimensions[column[0].column_letter].width = adjusted_width
-    
+        if engine == 'xlsxwriter':
+            for i, width in enumerate(widths):
+                worksheet.set_column(i, i, width)
+        else:
+            from openpyxl.utils import get_column_letter
+            for i, width in enumerate(widths, start=1):
+                worksheet.column_dimensions[get_column_letter(i)].width = width
+
+    # Plain bytes: st.download_button's marshalling accepts
+    # str/bytes/file-like only and raises on memoryview
     return output.getvalue()
 
+@st.cache_data(max_entries=8, show_spinner=False)
 def create_csv_download(df):
     """Create CSV file for download."""
-    return df.to_csv(index=False).encode('utf-8')
+    # pyarrow (optional) emits UTF-8 bytes directly from multi-threaded
+    # C++; pandas' formatter builds one big intermediate str and then
+    # re-encodes it, two full passes and copies for large result sets
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return df.to_csv(index=False).encode('utf-8')
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    # One to_pybytes() copy: Streamlit's download marshalling rejects
+    # memoryview, so the arrow buffer has to land in plain bytes
+    return buf.getvalue().to_pybytes()
 
 # Sidebar navigation
 page = st.sidebar.selectbox(